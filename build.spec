@@ -15,19 +15,16 @@ Output:
 
 import sys
 import os
-from PyInstaller.utils.hooks import collect_dynamic_libs, collect_data_files
 
 block_cipher = None
 
-# Collect PyMuPDF dynamic libraries and data files
-pymupdf_binaries = collect_dynamic_libs('pymupdf')
-pymupdf_datas = collect_data_files('pymupdf')
+# PyMuPDF libraries and data are collected by hook-pymupdf.py (see hookspath)
 
 a = Analysis(
     ['src/main.py'],
     pathex=['src'],  # Add src directory to module search path
-    binaries=pymupdf_binaries,
-    datas=pymupdf_datas + [
+    binaries=[],
+    datas=[
         # ('bin/antiword.exe', '.'),  # Bundle antiword for .doc parsing (optional - download separately)
     ],
     hiddenimports=[
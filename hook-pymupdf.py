@@ -1,14 +1,25 @@
-"""Custom PyInstaller hook for PyMuPDF to bundle all necessary DLLs."""
-from PyInstaller.utils.hooks import collect_dynamic_libs, collect_data_files, collect_submodules
+"""Custom PyInstaller hook for PyMuPDF to bundle only what text extraction needs."""
+from PyInstaller.utils.hooks import collect_dynamic_libs, collect_data_files
 
-# Collect all submodules
-hiddenimports = collect_submodules('pymupdf')
-hiddenimports += collect_submodules('fitz')
+# Submodules loaded at runtime by `import fitz` + text extraction
+# (pymupdf.__main__, _apply_pages and _table_union are never imported)
+hiddenimports = [
+    'pymupdf',
+    'pymupdf.pymupdf',
+    'pymupdf.mupdf',
+    'pymupdf.extra',
+    'pymupdf.utils',
+    'pymupdf.table',
+    'pymupdf._build',
+    'pymupdf._table_headers',
+    'pymupdf._table_refine',
+    'pymupdf._table_spans',
+    'pymupdf._wxcolors',
+    'fitz',
+]
 
-# Collect all dynamic libraries (DLLs)
+# MuPDF shared libraries (fonts and CMaps are compiled into libmupdf)
 binaries = collect_dynamic_libs('pymupdf')
-binaries += collect_dynamic_libs('fitz')
 
-# Collect all data files
-datas = collect_data_files('pymupdf')
-datas += collect_data_files('fitz')
+# Skip the C/C++ development headers and import libraries shipped in the wheel
+datas = collect_data_files('pymupdf', excludes=['mupdf-devel', 'mupdf-devel/**'])
@@ -2,25 +2,95 @@
 
 import sys
 import os
+import atexit
+import logging
+import subprocess
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from models.document import Document
 from models.keyword import Keyword
 from models.configuration import Configuration
 from models.application_state import ApplicationState, ProcessingStatus
 from models.batch_extraction_results import BatchExtractionResults
-from controllers.state_manager import StateManager
-from controllers.thread_coordinator import ThreadCoordinator, ProgressReporter
+from models.extraction_results import ExtractionResults
+from .state_manager import StateManager
+from .thread_coordinator import ThreadCoordinator, ProgressReporter
 from parsers.factory import ParserFactory
 from extractors.extraction_engine import ExtractionEngine
+from extractors.keyword_matcher import KeywordMatcher
 from services.output_generator import OutputGenerator
-from services.processing_logger import ProcessingLogger
+from services.processing_logger import ProcessingLogger, NullProcessingLogger
 from services.configuration_manager import ConfigurationManager
 
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _cached_meta(path: str, mtime_ns: int, size: int) -> tuple[bool, int, str]:
+    """Validate a document and count its pages, cached by file signature.
+
+    The (mtime_ns, size) pair is part of the cache key, so a modified file
+    is validated again. Errors from get_page_count are not cached.
+
+    Args:
+        path: Absolute path to document file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Tuple of (is_valid, page_count, error_message)
+    """
+    parser = ParserFactory.create(path)
+    validation_result = parser.validate(path)
+    if not validation_result.is_valid:
+        return False, 0, validation_result.error_message or "Unknown error"
+
+    return True, parser.get_page_count(path), ""
+
+
+def _extract_document(document: Document, keywords: list, automaton=None,
+                      executor: Optional[ProcessPoolExecutor] = None) -> ExtractionResults:
+    """Parse a document and extract data from it page by page.
+
+    Module-level so that it can also run in a worker process.
+
+    Args:
+        document: Document to process
+        keywords: Keywords to extract (text or Keyword objects)
+        automaton: Optional prebuilt KeywordMatcher.build_automaton(keywords)
+        executor: Optional process pool for parallel page reading
+
+    Returns:
+        ExtractionResults for the document
+
+    Raises:
+        ParsingError: If the document can't be parsed
+    """
+    parser = ParserFactory.create(document.file_path)
+    return ExtractionEngine().extract_stream(
+        parser.iter_pages(document.file_path, executor), keywords, document, automaton
+    )
+
+
+@lru_cache(maxsize=1024)
+def _make_keyword(text: str, is_historical: bool) -> Keyword:
+    """Create Keyword, reusing instances for repeated preset loads.
+
+    Keywords are never mutated after creation, so instances can be shared.
+
+    Args:
+        text: Keyword text
+        is_historical: Whether from keyword history
+
+    Returns:
+        Keyword instance
+    """
+    return Keyword.from_text(text, is_historical=is_historical)
+
 
 class AppController:
     """Application controller coordinating UI and business logic.
@@ -47,13 +117,22 @@ class AppController:
         
         # Services
         self.output_generator = OutputGenerator()
-        self.logger: Optional[ProcessingLogger] = None
+        self.logger: ProcessingLogger | NullProcessingLogger = NullProcessingLogger()
         
         # UI callbacks
         self._ui_update_callback: Optional[Callable[[ApplicationState], None]] = None
         self._error_callback: Optional[Callable[[str], None]] = None
         self._success_callback: Optional[Callable[[str], None]] = None
         self._poll_callback: Optional[Callable[[int, Callable], None]] = None
+
+        # Adaptive worker polling (backs off while the queue stays empty)
+        self._poll_interval_ms = 50
+        self._empty_ticks = 0
+
+        # Debounced config persistence
+        self._config_dirty = False
+        self._save_scheduled = False
+        atexit.register(self.shutdown)
         
         # Register state change observer
         self.state_manager.add_observer(self._on_state_changed)
@@ -85,10 +164,13 @@ class AppController:
     def set_poll_callback(self, callback: Callable[[int, Callable], None]) -> None:
         """Set callback for scheduling polling.
         
+        The callback is also used to coalesce state change notifications.
+        
         Args:
             callback: Function(milliseconds: int, func: Callable) -> None
         """
         self._poll_callback = callback
+        self.state_manager.set_scheduler(callback)
     
     def on_file_selected(self, file_path: str) -> None:
         """Handle single file selection (backward compatibility).
@@ -104,7 +186,7 @@ class AppController:
         Args:
             file_paths: List of file paths to process
         """
-        print(f"DEBUG AppController.on_files_selected called with {len(file_paths)} files")
+        log.debug("on_files_selected called with %s files", len(file_paths))
         try:
             valid_documents = []
             errors = []
@@ -113,55 +195,45 @@ class AppController:
                 # Create document from file path
                 document = Document.from_path(file_path)
 
-                # Validate file exists
-                if not document.validate_exists():
-                    errors.append(f"File not found: {os.path.basename(file_path)}")
-                    continue
-
-                # Validate file is readable
-                if not document.validate_readable():
-                    errors.append(f"Not readable: {os.path.basename(file_path)}")
-                    continue
-
-                # Validate file size
-                if not document.validate_size(max_size_mb=50):
-                    errors.append(f"Too large: {os.path.basename(file_path)}")
-                    continue
-
-                # Validate document using parser
-                parser = ParserFactory.create(file_path)
-                validation_result = parser.validate(file_path)
-
-                if not validation_result.is_valid:
-                    document.mark_invalid(validation_result.error_message or "Unknown error")
-                    errors.append(f"Invalid: {os.path.basename(file_path)}")
+                # Validate file exists, is readable and not too large
+                is_valid, reason, st = document.validate_all(max_size_mb=50)
+                if not is_valid:
+                    errors.append(f"{reason}: {os.path.basename(file_path)}")
                     continue
 
-                # Get page count
+                # Validate document and get page count (cached per file signature
+                # from the stat result above)
                 try:
-                    page_count = parser.get_page_count(file_path)
-                    document.mark_valid(page_count)
-                    valid_documents.append(document)
+                    is_valid, page_count, error_message = _cached_meta(
+                        file_path, st.st_mtime_ns, st.st_size
+                    )
                 except Exception as e:
                     document.mark_invalid(f"Failed to get page count: {e}")
                     errors.append(f"Error: {os.path.basename(file_path)}")
                     continue
 
+                if not is_valid:
+                    document.mark_invalid(error_message)
+                    errors.append(f"Invalid: {os.path.basename(file_path)}")
+                    continue
+
+                document.mark_valid(page_count)
+                valid_documents.append(document)
+
             # Show errors if any
             if errors:
                 if not valid_documents:
                     self._show_error(f"All files invalid: {'; '.join(errors)}")
                     return
                 # Some errors but some valid - continue with valid ones
-                print(f"DEBUG: Skipped {len(errors)} invalid files")
+                log.debug("Skipped %s invalid files", len(errors))
 
             # Update state with valid documents
             self.state_manager.set_documents(valid_documents)
-            print(f"DEBUG: {len(valid_documents)} documents set")
+            log.debug("%s documents set", len(valid_documents))
 
         except Exception as e:
             self._show_error(f"Error selecting files: {e}")
-            import traceback
             traceback.print_exc()
     
     def on_keyword_added(self, keyword_text: str) -> None:
@@ -185,24 +257,20 @@ class AppController:
             keyword = Keyword.from_text(keyword_text, is_historical=False)
             
             # Check for duplicates
-            state = self.state_manager.get_state()
-            if any(kw.matches(keyword) for kw in state.active_keywords):
+            if self.state_manager.contains(keyword.normalized):
                 self._show_error(f"Keyword '{keyword_text}' already added")
                 return
             
             # Add keyword to state
             self.state_manager.add_keyword(keyword)
-            print(f"DEBUG: Keyword added: {keyword_text}")
+            log.debug("Keyword added: %s", keyword_text)
 
             # Add to history and save config (check for duplicates)
-            keyword_lower = keyword_text.lower()
-            if not any(kw.lower() == keyword_lower for kw in self.config.keyword_history):
-                self.config.keyword_history.append(keyword_text)
-                self.config_manager.save(self.config)
+            if self.config.append_keyword_to_history(keyword_text):
+                self._schedule_save()
             
         except Exception as e:
             self._show_error(f"Error adding keyword: {e}")
-            import traceback
             traceback.print_exc()
     
     def on_keyword_removed(self, keyword_text: str) -> None:
@@ -234,8 +302,7 @@ class AppController:
             keyword = Keyword.from_text(keyword_text, is_historical=True)
             
             # Check for duplicates
-            state = self.state_manager.get_state()
-            if any(kw.matches(keyword) for kw in state.active_keywords):
+            if self.state_manager.contains(keyword.normalized):
                 self._show_error(f"Keyword '{keyword_text}' already added")
                 return
             
@@ -255,7 +322,7 @@ class AppController:
         try:
             success, error = self.config.add_preset(name, keywords)
             if success:
-                self.config_manager.save(self.config)
+                self._schedule_save()
                 # Refresh KeywordPanel presets (handled by main_window)
             else:
                 self._show_error(error)
@@ -269,26 +336,30 @@ class AppController:
             preset_name: Name of preset to load
         """
         try:
-            print(f"DEBUG: Loading preset '{preset_name}'")
+            log.debug("Loading preset '%s'", preset_name)
             preset = self.config.get_preset_by_name(preset_name)
             if preset:
-                print(f"DEBUG: Found preset with {len(preset['keywords'])} keywords: {preset['keywords']}")
-                # Clear existing keywords
-                self.state_manager.clear_keywords()
-                print(f"DEBUG: Cleared keywords")
-                
-                # Add preset keywords
-                for keyword_text in preset['keywords']:
-                    keyword = Keyword.from_text(keyword_text, is_historical=False)
-                    self.state_manager.add_keyword(keyword)
-                    print(f"DEBUG: Added keyword '{keyword_text}'")
+                log.debug("Found preset with %s keywords: %s",
+                          len(preset['keywords']), preset['keywords'])
+                # Replace keywords with a single UI update
+                with self.state_manager.batch():
+                    # Clear existing keywords
+                    self.state_manager.clear_keywords()
+                    log.debug("Cleared keywords")
+                    
+                    # Add preset keywords
+                    for keyword_text in preset['keywords']:
+                        keyword = _make_keyword(keyword_text, False)
+                        self.state_manager.add_keyword(keyword)
+                        log.debug("Added keyword '%s'", keyword_text)
                 
-                print(f"DEBUG: Final state has {len(self.state_manager.get_state().active_keywords)} keywords")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Final state has %s keywords",
+                              len(self.state_manager.get_state().active_keywords))
             else:
                 self._show_error(f"Preset '{preset_name}' not found")
         except Exception as e:
             self._show_error(f"Error loading preset: {e}")
-            import traceback
             traceback.print_exc()
     
     def on_preset_updated(self, old_name: str, new_name: str, keywords: list[str]) -> None:
@@ -302,7 +373,7 @@ class AppController:
         try:
             success, error = self.config.update_preset(old_name, new_name, keywords)
             if success:
-                self.config_manager.save(self.config)
+                self._schedule_save()
                 # Refresh KeywordPanel presets (handled by main_window)
             else:
                 self._show_error(error)
@@ -317,7 +388,7 @@ class AppController:
         """
         try:
             if self.config.delete_preset(name):
-                self.config_manager.save(self.config)
+                self._schedule_save()
                 # Refresh KeywordPanel presets (handled by main_window)
             else:
                 self._show_error(f"Preset '{name}' not found")
@@ -332,17 +403,20 @@ class AppController:
         """
         try:
             self.config.presets_section_expanded = expanded
-            self.config_manager.save(self.config)
+            self._schedule_save()
         except Exception as e:
             self._show_error(f"Error saving preset section state: {e}")
     
     def on_extract_clicked(self) -> None:
         """Handle extract button click."""
-        print("DEBUG: Extract button clicked!")
+        log.debug("Extract button clicked!")
         try:
             # Check if extraction can start
             state = self.state_manager.get_state()
-            print(f"DEBUG: State - docs: {len(state.current_documents)}, keywords: {len(state.active_keywords)}, can_extract: {self.state_manager.can_start_extraction()}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("State - docs: %s, keywords: %s, can_extract: %s",
+                          len(state.current_documents), len(state.active_keywords),
+                          self.state_manager.can_start_extraction())
 
             if not self.state_manager.can_start_extraction():
                 self._show_error("Cannot start extraction. Please select files and add keywords.")
@@ -370,6 +444,8 @@ class AppController:
             )
 
             # Start polling for messages
+            self._poll_interval_ms = 50
+            self._empty_ticks = 0
             self._poll_worker_messages()
 
         except Exception as e:
@@ -392,6 +468,7 @@ class AppController:
             # Save configuration
             if self.config_manager.save(new_config):
                 self.config = new_config
+                self._config_dirty = False
                 self._show_success("Settings saved successfully")
             else:
                 self._show_error("Failed to save settings")
@@ -406,19 +483,16 @@ class AppController:
             folder_path: New output folder path
         """
         try:
-            # Validate folder
-            path = Path(folder_path)
-            if not path.exists():
-                # Try to create
-                path.mkdir(parents=True, exist_ok=True)
-            
-            if not path.is_dir():
+            # Create if missing; makedirs succeeds only for an existing or new directory
+            try:
+                os.makedirs(folder_path, exist_ok=True)
+            except FileExistsError:
                 self._show_error(f"Not a valid directory: {folder_path}")
                 return
             
             # Update config
             self.config.output_folder = folder_path
-            self.config_manager.save(self.config)
+            self._schedule_save()
             
         except Exception as e:
             self._show_error(f"Error changing output folder: {e}")
@@ -430,23 +504,50 @@ class AppController:
             directory_path: New log directory path
         """
         try:
-            # Validate directory
-            path = Path(directory_path)
-            if not path.exists():
-                # Try to create
-                path.mkdir(parents=True, exist_ok=True)
-            
-            if not path.is_dir():
+            # Create if missing; makedirs succeeds only for an existing or new directory
+            try:
+                os.makedirs(directory_path, exist_ok=True)
+            except FileExistsError:
                 self._show_error(f"Not a valid directory: {directory_path}")
                 return
             
             # Update config
             self.config.log_directory = directory_path
-            self.config_manager.save(self.config)
+            self._schedule_save()
             
         except Exception as e:
             self._show_error(f"Error changing log directory: {e}")
     
+    def _schedule_save(self) -> None:
+        """Mark configuration dirty and schedule a single deferred save.
+
+        Rapid successive changes are coalesced into one write. Without a
+        poll callback (no UI loop) the configuration is saved immediately.
+        """
+        self._config_dirty = True
+        if self._save_scheduled:
+            return
+
+        if self._poll_callback:
+            self._save_scheduled = True
+            self._poll_callback(500, self._flush_config)
+        else:
+            self._flush_config()
+
+    def _flush_config(self) -> None:
+        """Persist configuration if there are unsaved changes."""
+        self._save_scheduled = False
+        if not self._config_dirty:
+            return
+
+        self._config_dirty = False
+        if not self.config_manager.save(self.config):
+            self._config_dirty = True
+
+    def shutdown(self) -> None:
+        """Flush pending configuration changes before exit."""
+        self._flush_config()
+
     def _perform_extraction(self, document: Document, keywords: list[Keyword]):
         """Perform extraction in worker thread.
 
@@ -462,30 +563,19 @@ class AppController:
         
         try:
             # Log start
-            if self.logger:
-                self.logger.log_event('INFO', f'Starting extraction: {document.filename}')
-            
-            reporter.report('Parsing document...')
-            
-            # Parse document
-            parser = ParserFactory.create(document.file_path)
-            parse_result = parser.parse(document.file_path)
-
-            if not parse_result.success:
-                raise Exception(parse_result.error_message or "Failed to parse document")
-
-            if self.logger:
-                self.logger.log_event('INFO', f'Document parsed successfully: {len(parse_result.pages)} pages')
+            self.logger.log_event('INFO', f'Starting extraction: {document.filename}')
             
             reporter.report('Extracting data...')
 
-            # Extract data
-            extraction_engine = ExtractionEngine()
-            keyword_texts = [kw.text for kw in keywords]
-            results = extraction_engine.extract(parse_result.pages, keyword_texts, document)
+            # Parse and extract page by page
+            executor = self._create_page_executor()
+            try:
+                results = _extract_document(document, keywords, executor=executor)
+            finally:
+                if executor:
+                    executor.shutdown(cancel_futures=True)
             
-            if self.logger:
-                self.logger.log_event('INFO', f'Extraction complete: {len(results.matches)} matches')
+            self.logger.log_event('INFO', f'Extraction complete: {len(results.matches)} matches')
             
             reporter.report('Generating output...')
             
@@ -498,19 +588,17 @@ class AppController:
             results.output_path = output_result.output_path
 
             # Save log path before finalizing
-            if self.logger:
-                results.log_path = self.logger.get_log_path()
-                self.logger.log_event('INFO', f'Output written to: {output_result.output_path}')
-                self.logger.finalize('success', results)
+            results.log_path = self.logger.get_log_path()
+            self.logger.log_event('INFO', f'Output written to: {output_result.output_path}')
+            self.logger.finalize('success', results)
 
             reporter.report('Complete!')
 
             return results
 
         except Exception as e:
-            if self.logger:
-                self.logger.log_event('ERROR', f'Extraction failed: {e}')
-                self.logger.finalize('failure', None)
+            self.logger.log_event('ERROR', f'Extraction failed: {e}')
+            self.logger.finalize('failure', None)
             raise
 
     def _perform_batch_extraction(self, documents: list[Document], keywords: list[Keyword]):
@@ -527,39 +615,42 @@ class AppController:
         keyword_texts = [kw.text for kw in keywords]
         batch_results = BatchExtractionResults(keywords=keyword_texts)
 
+        # Build keyword automaton once for all documents
+        automaton = KeywordMatcher.build_automaton(keyword_texts)
+
+        executor = self._create_page_executor()
         try:
-            if self.logger:
-                self.logger.log_event('INFO', f'Starting batch extraction: {len(documents)} documents')
+            self.logger.log_event('INFO', f'Starting batch extraction: {len(documents)} documents')
+
+            # With a process pool and several documents, extract whole
+            # documents in worker processes (pages are then read sequentially)
+            futures = None
+            if executor is not None and len(documents) > 1:
+                futures = [
+                    executor.submit(_extract_document, document, keyword_texts, automaton)
+                    for document in documents
+                ]
 
             for i, document in enumerate(documents):
                 reporter.report(f'Processing file {i+1} of {len(documents)}: {document.filename}')
 
                 try:
-                    if self.logger:
-                        self.logger.log_event('INFO', f'Processing: {document.filename}')
-
-                    # Parse document
-                    parser = ParserFactory.create(document.file_path)
-                    parse_result = parser.parse(document.file_path)
-
-                    if not parse_result.success:
-                        batch_results.add_warning(f"Failed to parse: {document.filename}")
-                        if self.logger:
-                            self.logger.log_event('WARNING', f'Parse failed: {document.filename}')
-                        continue
-
-                    # Extract data
-                    extraction_engine = ExtractionEngine()
-                    results = extraction_engine.extract(parse_result.pages, keyword_texts, document)
+                    self.logger.log_event('INFO', f'Processing: {document.filename}')
+
+                    # Parse and extract page by page (parse errors raise)
+                    if futures is not None:
+                        results = futures[i].result()
+                    else:
+                        results = _extract_document(document, keyword_texts, automaton, executor)
                     batch_results.add_result(results)
 
-                    if self.logger:
-                        self.logger.log_event('INFO', f'Extracted {len(results.matches)} matches from {document.filename}')
+                    self.logger.log_event(
+                        'INFO', f'Extracted {len(results.matches)} matches from {document.filename}'
+                    )
 
                 except Exception as e:
                     batch_results.add_warning(f"Error processing {document.filename}: {e}")
-                    if self.logger:
-                        self.logger.log_event('ERROR', f'Error processing {document.filename}: {e}')
+                    self.logger.log_event('ERROR', f'Error processing {document.filename}: {e}')
 
             reporter.report('Generating batch output...')
 
@@ -568,30 +659,73 @@ class AppController:
 
             if output_result.success:
                 batch_results.output_path = output_result.output_path
-                if self.logger:
-                    self.logger.log_event('INFO', f'Batch output written to: {output_result.output_path}')
+                self.logger.log_event(
+                    'INFO', f'Batch output written to: {output_result.output_path}'
+                )
             else:
                 batch_results.add_warning(f"Failed to generate output: {output_result.error_message}")
-                if self.logger:
-                    self.logger.log_event('ERROR', f'Output generation failed: {output_result.error_message}')
+                self.logger.log_event(
+                    'ERROR', f'Output generation failed: {output_result.error_message}'
+                )
 
-            if self.logger:
-                self.logger.log_event('INFO', f'Batch complete: {batch_results.document_count} documents processed')
-                self.logger.finalize('success', None)
+            self.logger.log_event(
+                'INFO', f'Batch complete: {batch_results.document_count} documents processed'
+            )
+            self.logger.finalize('success', None)
 
             reporter.report('Complete!')
 
             return batch_results
 
         except Exception as e:
-            if self.logger:
-                self.logger.log_event('ERROR', f'Batch extraction failed: {e}')
-                self.logger.finalize('failure', None)
+            self.logger.log_event('ERROR', f'Batch extraction failed: {e}')
+            self.logger.finalize('failure', None)
             raise
 
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+    def _create_page_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Create process pool for parallel extraction if enabled.
+
+        Worker processes are started lazily, so small documents that are
+        read sequentially never pay the start-up cost.
+
+        Returns:
+            ProcessPoolExecutor, or None if parallel extraction is disabled
+        """
+        if not self.config.parallel_extraction:
+            return None
+        return ProcessPoolExecutor()
+
     def _poll_worker_messages(self) -> None:
         """Poll for messages from worker thread."""
-        # Check for messages
+        # Read running flag before draining so a final message isn't missed
+        still_running = self.thread_coordinator.is_running()
+
+        # Poll fast while messages stream in, back off when idle
+        if self._drain_messages():
+            self._empty_ticks = 0
+            self._poll_interval_ms = 50
+        else:
+            self._empty_ticks += 1
+            self._poll_interval_ms = min(500, 50 * 2 ** self._empty_ticks)
+        
+        # Continue polling if still running
+        if still_running:
+            # Schedule next poll using UI callback, right away if messages
+            # arrived while the previous batch was being handled
+            if self._poll_callback:
+                delay = 0 if self.thread_coordinator.has_messages() else self._poll_interval_ms
+                self._poll_callback(delay, self._poll_worker_messages)
+    
+    def _drain_messages(self) -> int:
+        """Handle all queued worker messages.
+
+        Returns:
+            Number of messages handled
+        """
         messages = self.thread_coordinator.check_messages()
 
         for msg in messages:
@@ -613,13 +747,9 @@ class AppController:
                 error_message = msg.get('message', 'Unknown error')
                 self.state_manager.fail_processing(error_message)
                 self._show_error(f"Extraction failed: {error_message}")
-        
-        # Continue polling if still running
-        if self.thread_coordinator.is_running():
-            # Schedule next poll in 100ms using UI callback
-            if self._poll_callback:
-                self._poll_callback(100, self._poll_worker_messages)
-    
+
+        return len(messages)
+
     def get_worker_messages(self) -> list[dict]:
         """Get messages from worker thread (for UI polling).
         
@@ -634,13 +764,13 @@ class AppController:
         Args:
             state: New application state
         """
-        print(f"DEBUG AppController: _on_state_changed called with {len(state.active_keywords)} keywords")
-        print(f"DEBUG AppController: UI callback registered: {self._ui_update_callback is not None}")
+        log.debug("_on_state_changed called with %s keywords", len(state.active_keywords))
+        log.debug("UI callback registered: %s", self._ui_update_callback is not None)
         # Notify UI
         if self._ui_update_callback:
             self._ui_update_callback(state)
         else:
-            print(f"DEBUG AppController: ERROR - No UI update callback registered!")
+            log.warning("No UI update callback registered!")
     
     def _show_error(self, message: str) -> None:
         """Show error message to user.
@@ -684,7 +814,6 @@ class AppController:
                 output_path = state.extraction_results.output_path
                 if output_path and Path(output_path).exists():
                     # Open file with default application
-                    import subprocess
                     if sys.platform == 'darwin':  # macOS
                         subprocess.run(['open', output_path])
                     elif sys.platform == 'win32':  # Windows
@@ -704,7 +833,6 @@ class AppController:
             output_folder = self.config.output_folder
             if Path(output_folder).exists():
                 # Open folder with default file manager
-                import subprocess
                 if sys.platform == 'darwin':  # macOS
                     subprocess.run(['open', output_folder])
                 elif sys.platform == 'win32':  # Windows
@@ -719,11 +847,10 @@ class AppController:
     def on_open_log_file(self) -> None:
         """Handle open log file action."""
         try:
-            if self.logger and hasattr(self.logger, 'log_path'):
+            if hasattr(self.logger, 'log_path'):
                 log_path = self.logger.log_path
                 if log_path and Path(log_path).exists():
                     # Open file with default application
-                    import subprocess
                     if sys.platform == 'darwin':  # macOS
                         subprocess.run(['open', log_path])
                     elif sys.platform == 'win32':  # Windows
@@ -1,27 +1,27 @@
 """StateManager - Thread-safe application state management."""
 
-import threading
-import sys
-import os
-from copy import deepcopy
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+from contextlib import contextmanager
 from typing import Union
+
 from models.application_state import ApplicationState, ProcessingStatus
 from models.document import Document
 from models.keyword import Keyword
 from models.extraction_results import ExtractionResults
 from models.batch_extraction_results import BatchExtractionResults
 
+# Optional: fastrlock skips the OS mutex when the lock is uncontended
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:
+    from threading import RLock as _RLock
+
 
 class StateManager:
     """Thread-safe manager for application state.
 
     Features:
     - Thread-safe state updates using locks
-    - Immutable state pattern (returns copies)
+    - Immutable state pattern (returns snapshots)
     - State transition validation
     - Observer pattern for state change notifications
     """
@@ -29,17 +29,24 @@ class StateManager:
     def __init__(self):
         """Initialize state manager."""
         self._state = ApplicationState()
-        self._lock = threading.RLock()
-        self._observers = []
+        self._lock = _RLock()
+        # Copy-on-write: replaced, never mutated, so it can be read without copying
+        self._observers: tuple = ()
+        # Notification batching (see batch())
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # Deferred notification (see set_scheduler())
+        self._scheduler = None
+        self._notify_pending = False
 
     def get_state(self) -> ApplicationState:
-        """Get current state (immutable copy).
+        """Get current state (snapshot).
 
         Returns:
-            Copy of current application state
+            Snapshot of current application state
         """
         with self._lock:
-            return deepcopy(self._state)
+            return self._state.snapshot()
 
     def set_document(self, document: Document) -> None:
         """Set current document (backward compatibility).
@@ -85,6 +92,18 @@ class StateManager:
             self._state.clear_keywords()
             self._notify_observers()
 
+    def contains(self, keyword_text: str) -> bool:
+        """Check if a keyword is already active (case-insensitive).
+
+        Args:
+            keyword_text: Keyword text to look up
+
+        Returns:
+            True if an active keyword matches
+        """
+        with self._lock:
+            return self._state.has_keyword(keyword_text)
+
     def start_processing(self) -> bool:
         """Start processing (if allowed).
 
@@ -137,20 +156,22 @@ class StateManager:
     def is_processing(self) -> bool:
         """Check if currently processing.
 
+        Reads a single attribute, which is atomic, so no lock is taken.
+
         Returns:
             True if processing
         """
-        with self._lock:
-            return self._state.is_processing
+        return self._state.is_processing
 
     def get_processing_status(self) -> ProcessingStatus:
         """Get current processing status.
 
+        Reads a single attribute, which is atomic, so no lock is taken.
+
         Returns:
             Current processing status
         """
-        with self._lock:
-            return self._state.processing_status
+        return self._state.processing_status
 
     def add_error(self, error_message: str) -> None:
         """Add error message to state.
@@ -177,7 +198,7 @@ class StateManager:
         """
         with self._lock:
             if callback not in self._observers:
-                self._observers.append(callback)
+                self._observers = self._observers + (callback,)
 
     def remove_observer(self, callback) -> None:
         """Remove state change observer.
@@ -187,17 +208,75 @@ class StateManager:
         """
         with self._lock:
             if callback in self._observers:
-                self._observers.remove(callback)
+                observers = list(self._observers)
+                observers.remove(callback)
+                self._observers = tuple(observers)
+
+    def set_scheduler(self, scheduler) -> None:
+        """Coalesce notifications through a scheduler instead of sending them inline.
+
+        Changes made before the scheduled callback runs produce a single
+        notification with the latest state.
+
+        Args:
+            scheduler: Function(milliseconds: int, func: Callable) -> None,
+                e.g. Tk's after(); None to notify inline
+        """
+        with self._lock:
+            self._scheduler = scheduler
+
+    @contextmanager
+    def batch(self):
+        """Group several state changes into a single observer notification.
+
+        Observers are notified once when the outermost batch exits, and
+        only if the state changed. Batches may be nested.
+
+        Example:
+            with state_manager.batch():
+                state_manager.clear_keywords()
+                state_manager.add_keyword(keyword)
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    self._batch_dirty = False
+                    self._notify_observers()
 
     def _notify_observers(self) -> None:
         """Notify all observers of state change."""
-        # Create immutable copy for observers
-        state_copy = deepcopy(self._state)
+        # Defer until the enclosing batch ends
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+
+        # Defer until the scheduled flush, once per burst of changes
+        if self._scheduler is not None:
+            if not self._notify_pending:
+                self._notify_pending = True
+                self._scheduler(0, self._flush_notifications)
+            return
+
+        self._dispatch()
+
+    def _flush_notifications(self) -> None:
+        """Send the notification deferred by _notify_observers()."""
+        with self._lock:
+            if not self._notify_pending:
+                return
+            self._notify_pending = False
+            self._dispatch()
 
-        # Call observers (outside lock to prevent deadlocks)
-        observers = self._observers.copy()
+    def _dispatch(self) -> None:
+        """Call all observers with a snapshot of the current state."""
+        # Create snapshot for observers
+        state_copy = self._state.snapshot()
 
-        for observer in observers:
+        for observer in self._observers:
             try:
                 observer(state_copy)
             except Exception as e:
@@ -212,4 +291,5 @@ class StateManager:
         """
         with self._lock:
             updater(self._state)
+            self._state.reindex()
             self._notify_observers()
@@ -2,11 +2,6 @@
 
 import threading
 import queue
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from models.extraction_results import ExtractionResults
 
@@ -24,8 +19,13 @@ class ThreadCoordinator:
     def __init__(self):
         """Initialize thread coordinator."""
         self._worker_thread = None
-        self._message_queue = queue.Queue()
-        self._is_running = False
+        # Single producer (worker) -> single consumer (UI thread); SimpleQueue
+        # is a lock-free C deque without Queue's Condition/task tracking
+        self._message_queue = queue.SimpleQueue()
+        # Set whenever a message is queued, cleared when messages are drained
+        self._has_messages = threading.Event()
+        # Set while a worker is running (shared by worker and main thread)
+        self._running = threading.Event()
 
     def start_extraction(self, extraction_func, *args, **kwargs) -> None:
         """Start extraction in background thread.
@@ -36,15 +36,16 @@ class ThreadCoordinator:
             **kwargs: Keyword arguments for extraction_func
         """
         # Don't start if already running
-        if self._is_running:
+        if self._running.is_set():
             self.send_error("Extraction already in progress")
             return
 
-        # Clear old messages
-        self._clear_queue()
+        # Drop old messages
+        self._message_queue = queue.SimpleQueue()
+        self._has_messages.clear()
 
         # Create and start worker thread
-        self._is_running = True
+        self._running.set()
         self._worker_thread = threading.Thread(
             target=self._worker_wrapper,
             args=(extraction_func, args, kwargs),
@@ -72,7 +73,7 @@ class ThreadCoordinator:
             self.send_error(str(e))
 
         finally:
-            self._is_running = False
+            self._running.clear()
 
     def send_progress(self, message: str) -> None:
         """Send progress update from worker thread.
@@ -84,6 +85,7 @@ class ThreadCoordinator:
             'type': 'progress',
             'message': message
         })
+        self._has_messages.set()
 
     def send_complete(self, results: ExtractionResults) -> None:
         """Send completion message from worker thread.
@@ -95,6 +97,7 @@ class ThreadCoordinator:
             'type': 'complete',
             'results': results
         })
+        self._has_messages.set()
 
     def send_error(self, error_message: str) -> None:
         """Send error message from worker thread.
@@ -106,6 +109,7 @@ class ThreadCoordinator:
             'type': 'error',
             'message': error_message
         })
+        self._has_messages.set()
 
     def check_messages(self) -> list[dict]:
         """Check for messages from worker thread (called from main thread).
@@ -115,23 +119,33 @@ class ThreadCoordinator:
         """
         messages = []
 
+        # Clear first so messages queued while draining re-set the flag
+        self._has_messages.clear()
+
         # Get all available messages
-        while not self._message_queue.empty():
+        while True:
             try:
-                msg = self._message_queue.get_nowait()
-                messages.append(msg)
+                messages.append(self._message_queue.get_nowait())
             except queue.Empty:
                 break
 
         return messages
 
+    def has_messages(self) -> bool:
+        """Check if messages were queued since the last check_messages() call.
+
+        Returns:
+            True if messages are waiting
+        """
+        return self._has_messages.is_set()
+
     def is_running(self) -> bool:
         """Check if worker thread is running.
 
         Returns:
             True if worker thread is active
         """
-        return self._is_running
+        return self._running.is_set()
 
     def wait_for_completion(self, timeout: float = None) -> bool:
         """Wait for worker thread to complete.
@@ -148,14 +162,6 @@ class ThreadCoordinator:
 
         return True
 
-    def _clear_queue(self):
-        """Clear all messages from queue."""
-        while not self._message_queue.empty():
-            try:
-                self._message_queue.get_nowait()
-            except queue.Empty:
-                break
-
 
 class ProgressReporter:
     """Helper class for reporting progress from worker thread."""
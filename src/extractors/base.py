@@ -2,17 +2,12 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from parsers.base import PageContent
 from models.extraction_results import ExtractionResults
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordMatch:
     """Keyword found in document with location information.
 
@@ -21,12 +16,15 @@ class KeywordMatch:
         page_number: Page where keyword was found (1-indexed)
         line_number: Line number within page (1-indexed)
         line_text: Full line containing the keyword
+        keyword_end: Offset in line_text just past the first occurrence,
+            if known
     """
 
     keyword: str
     page_number: int
     line_number: int
     line_text: str
+    keyword_end: int | None = None
 
     def __post_init__(self):
         """Validate keyword match after initialization."""
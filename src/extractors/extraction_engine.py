@@ -1,20 +1,41 @@
 """Extraction engine orchestrating all extractors."""
 
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import time
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from typing import Iterable
 
 from parsers.base import PageContent
 from extractors.base import ExtractionEngine as BaseEngine
-from extractors.keyword_matcher import KeywordMatcher
+from extractors.keyword_matcher import KeywordMatcher, KeywordScanner
 from extractors.number_extractor import NumberExtractor
-from extractors.personal_info_extractor import PersonalInfoExtractor
+from extractors.personal_info_extractor import PersonalInfoExtractor, PersonalInfoCollector
 from models.extraction_results import ExtractionResults
+from models.extraction_match import ExtractionMatch
 from models.document import Document
+from models.keyword import Keyword
+
+# Free-threaded CPython builds (no GIL) can scan pages on several cores
+FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+@lru_cache(maxsize=1024)
+def _not_found_match(keyword: str) -> ExtractionMatch:
+    """Get the shared "Not found" entry for a keyword absent from a document.
+
+    Matches are not modified after creation, so one instance per keyword
+    is reused across documents.
+    """
+    return ExtractionMatch(
+        keyword=keyword,
+        value='Not found',
+        page_number=1,
+        line_number=None,
+        status='not_found',
+        warning=None
+    )
 
 
 class ExtractionEngine(BaseEngine):
@@ -33,19 +54,84 @@ class ExtractionEngine(BaseEngine):
         self.number_extractor = NumberExtractor()
         self.personal_info_extractor = PersonalInfoExtractor()
 
-    def extract(self, pages: list[PageContent], keywords: list[str],
-                document: Document | None = None) -> ExtractionResults:
+    def extract(self, pages: list[PageContent], keywords: list[str | Keyword],
+                document: Document | None = None, automaton=None) -> ExtractionResults:
         """Extract data from parsed document pages.
 
         Args:
             pages: List of PageContent from parser
-            keywords: List of keywords to search for
+            keywords: Keywords to search for (text or Keyword objects)
             document: Optional Document reference
+            automaton: Optional prebuilt KeywordMatcher.build_automaton(keywords),
+                reused across documents sharing the same keywords
 
         Returns:
             ExtractionResults with all matches, personal info, errors, warnings
         """
-        start_time = time.time()
+        return self.extract_stream(pages, keywords, document, automaton)
+
+    def extract_stream(self, pages: Iterable[PageContent], keywords: list[str | Keyword],
+                       document: Document | None = None, automaton=None) -> ExtractionResults:
+        """Extract data from a stream of pages without retaining page text.
+
+        Each page is handed to the keyword scanner and the personal info
+        collector as it arrives. Exceptions raised by the page iterator
+        (e.g. parser errors) propagate to the caller.
+
+        Args:
+            pages: Iterable of PageContent, e.g. DocumentParser.iter_pages()
+            keywords: Keywords to search for (text or Keyword objects)
+            document: Optional Document reference
+            automaton: Optional prebuilt KeywordMatcher.build_automaton(keywords)
+
+        Returns:
+            ExtractionResults with all matches, personal info, errors, warnings
+        """
+        start_ns = time.perf_counter_ns()
+
+        keywords = [kw.text if isinstance(kw, Keyword) else kw for kw in keywords]
+
+        # Pages are scanned for keywords on worker threads when there is no GIL
+        scan_pool = ThreadPoolExecutor() if FREE_THREADED else None
+        try:
+            scanner = None
+            keyword_error = None
+            try:
+                scanner = KeywordScanner(keywords, automaton, scan_pool)
+            except Exception as e:
+                keyword_error = e
+
+            collector = PersonalInfoCollector(self.personal_info_extractor)
+            personal_info_error = None
+
+            # Feed each page to all extractors; a failing extractor stops
+            # receiving pages but doesn't abort the others
+            page_count = 0
+            for page in pages:
+                page_count += 1
+
+                if keyword_error is None:
+                    try:
+                        scanner.add_page(page)
+                    except Exception as e:
+                        keyword_error = e
+
+                if personal_info_error is None:
+                    try:
+                        collector.add_page(page)
+                    except Exception as e:
+                        personal_info_error = e
+
+            # Collect keyword occurrences
+            keyword_matches = []
+            if keyword_error is None:
+                try:
+                    keyword_matches = scanner.matches()
+                except Exception as e:
+                    keyword_error = e
+        finally:
+            if scan_pool is not None:
+                scan_pool.shutdown(cancel_futures=True)
 
         # Create results container
         if document:
@@ -59,23 +145,19 @@ class ExtractionEngine(BaseEngine):
                 file_path=str(Path.cwd() / 'unknown'),
                 filename='unknown',
                 file_type='pdf',
-                page_count=len(pages),
+                page_count=page_count,
                 is_valid=True
             )
             results = ExtractionResults.create(temp_doc)
 
         try:
-            # Step 1: Find keyword occurrences
-            keyword_matches = []
-            try:
-                keyword_matches = self.keyword_matcher.find_keywords(pages, keywords)
-            except Exception as e:
+            # Step 1: Report keyword matching failure
+            if keyword_error is not None:
                 results.add_error(
                     'keyword_matching_error',
-                    f'Failed to match keywords: {str(e)}',
+                    f'Failed to match keywords: {str(keyword_error)}',
                     {'keywords': keywords}
                 )
-
             # Step 2: Extract numbers for each keyword match
             try:
                 extraction_matches = self.number_extractor.extract_numbers(keyword_matches)
@@ -83,31 +165,20 @@ class ExtractionEngine(BaseEngine):
                 # Create a lookup of found matches by keyword
                 matches_by_keyword = {}
                 for match in extraction_matches:
-                    if match.keyword not in matches_by_keyword:
-                        matches_by_keyword[match.keyword] = []
-                    matches_by_keyword[match.keyword].append(match)
+                    matches_by_keyword.setdefault(match.keyword, []).append(match)
 
-                # Add matches in the original keyword order
+                # Collect matches in the original keyword order
+                ordered = []
                 for keyword in keywords:
                     if keyword in matches_by_keyword:
                         # Add all matches for this keyword (in case of multiple matches)
-                        for match in matches_by_keyword[keyword]:
-                            results.add_match(match)
-
-                            # Add warnings for ambiguous matches
-                            if match.warning:
-                                results.add_warning(match.warning)
+                        ordered.extend(matches_by_keyword[keyword])
                     else:
-                        # Keyword not found - create "not found" entry
-                        from models.extraction_match import ExtractionMatch
-                        results.add_match(ExtractionMatch(
-                            keyword=keyword,
-                            value='Not found',
-                            page_number=1,
-                            line_number=None,
-                            status='not_found',
-                            warning=None
-                        ))
+                        # Keyword not found - add "not found" entry
+                        ordered.append(_not_found_match(keyword))
+
+                # Add all matches, with warnings for ambiguous ones
+                results.extend_matches(ordered)
 
             except Exception as e:
                 results.add_error(
@@ -116,9 +187,11 @@ class ExtractionEngine(BaseEngine):
                     {}
                 )
 
-            # Step 3: Extract personal information
+            # Step 3: Collect personal information
             try:
-                personal_info = self.personal_info_extractor.extract_personal_info(pages)
+                if personal_info_error is not None:
+                    raise personal_info_error
+                personal_info = collector.result()
                 results.personal_info = personal_info
 
                 # Add warnings for missing personal info fields
@@ -149,8 +222,7 @@ class ExtractionEngine(BaseEngine):
             )
 
         # Calculate processing time
-        end_time = time.time()
-        results.processing_time = end_time - start_time
+        results.processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         results.timestamp = datetime.now()
 
         return results
@@ -1,15 +1,72 @@
 """Keyword matcher for finding keywords in document text."""
 
 import re
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from bisect import bisect_right
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import accumulate, chain
+from typing import Iterable
 
 from parsers.base import PageContent
 from extractors.base import KeywordMatch
 
+# Optional: pyahocorasick scans all keywords in one pass per line
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Characters that re.IGNORECASE treats as equal beyond plain lowercasing
+# (e.g. 'ı' ~ 'i', 'ς' ~ 'σ'), mapped to one representative so that
+# lowercased automaton matching agrees with the regex path
+_CASE_FIX = str.maketrans({
+    'ı': 'i', 'ſ': 's', '\u00b5': '\u03bc', '\u0345': '\u03b9', '\u1fbe': '\u03b9',
+    '\u1fd3': '\u0390', '\u1fe3': '\u03b0', 'ϐ': 'β', 'ϵ': 'ε', 'ϑ': 'θ', 'ϰ': 'κ',
+    'ϖ': 'π', 'ϱ': 'ρ', 'ς': 'σ', 'ϕ': 'φ', 'ᲀ': 'в', 'ᲁ': 'д', 'ᲂ': 'о', 'ᲃ': 'с',
+    'ᲄ': 'т', 'ᲅ': 'т', 'ᲆ': 'ъ', 'ᲇ': 'ѣ', 'ᲈ': 'ꙋ', 'ẛ': 'ṡ', 'ﬅ': 'ﬆ',
+})
+
+
+def _fold(text: str) -> str:
+    """Lowercase text for case-insensitive automaton matching."""
+    return text.lower().translate(_CASE_FIX)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(keyword: str) -> re.Pattern:
+    """Compile case-insensitive whole-word pattern for keyword (cached)."""
+    # Escape special regex characters to prevent injection
+    escaped_keyword = re.escape(keyword.strip())
+
+    # Create case-insensitive, Unicode-aware pattern
+    # Use word boundaries to avoid partial matches
+    return re.compile(
+        r'\b' + escaped_keyword + r'\b',
+        re.IGNORECASE | re.UNICODE
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_any(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile case-insensitive pattern matching any of the keywords (cached)."""
+    return re.compile(
+        '|'.join(re.escape(keyword) for keyword in keywords),
+        re.IGNORECASE | re.UNICODE
+    )
+
+
+def _is_word_char(char: str) -> bool:
+    """Check if character is a regex word character (\\w with re.UNICODE)."""
+    return char.isalnum() or char == '_'
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Check if position in text is a word boundary (same rules as regex \\b)."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
 
 class KeywordMatcher:
     """Find keywords in document text.
@@ -21,42 +78,203 @@ class KeywordMatcher:
     - Unicode support for Cyrillic/Latin text
     """
 
-    def find_keywords(self, pages: list[PageContent], keywords: list[str]) -> list[KeywordMatch]:
+    @staticmethod
+    def build_automaton(keywords: list[str]):
+        """Build an Aho-Corasick automaton for the given keywords.
+
+        Build once per extraction and pass to find_keywords() for every
+        document searched with the same keyword list.
+
+        Args:
+            keywords: List of keywords to search for
+
+        Returns:
+            Automaton, or None if pyahocorasick is not installed or a
+            keyword can't be matched exactly by the automaton (empty, or
+            lowercasing changes its length)
+        """
+        if ahocorasick is None:
+            return None
+
+        # Map folded keyword -> indices into keywords (duplicates allowed)
+        indices_by_word = {}
+        for index, keyword in enumerate(keywords):
+            keyword = keyword.strip()
+            word = _fold(keyword)
+            if not word or len(word) != len(keyword):
+                return None
+            indices_by_word.setdefault(word, []).append(index)
+
+        automaton = ahocorasick.Automaton()
+        for word, indices in indices_by_word.items():
+            automaton.add_word(word, (tuple(indices), len(word)))
+        automaton.make_automaton()
+
+        return automaton
+
+    def find_keywords(self, pages: Iterable[PageContent], keywords: list[str],
+                      automaton=None) -> list[KeywordMatch]:
         """Find all keyword occurrences in document.
 
         Args:
-            pages: Parsed document pages
+            pages: Parsed document pages (any iterable, consumed once)
             keywords: List of keywords to search for
+            automaton: Optional automaton from build_automaton(keywords)
 
         Returns:
             List of KeywordMatch with location information
         """
-        matches = []
-
-        for keyword in keywords:
-            # Normalize keyword
-            keyword_normalized = keyword.strip()
-
-            # Escape special regex characters to prevent injection
-            escaped_keyword = re.escape(keyword_normalized)
-
-            # Create case-insensitive, Unicode-aware pattern
-            # Use word boundaries to avoid partial matches
-            pattern = re.compile(
-                r'\b' + escaped_keyword + r'\b',
-                re.IGNORECASE | re.UNICODE
-            )
-
-            # Search all pages
-            for page in pages:
-                for line_num, line_text in enumerate(page.lines, start=1):
-                    # Find all matches in this line
-                    if pattern.search(line_text):
-                        matches.append(KeywordMatch(
-                            keyword=keyword_normalized,
-                            page_number=page.page_number,
-                            line_number=line_num,
-                            line_text=line_text
-                        ))
-
-        return matches
+        scanner = KeywordScanner(keywords, automaton)
+        for page in pages:
+            scanner.add_page(page)
+        return scanner.matches()
+
+
+class KeywordScanner:
+    """Incremental keyword search over a stream of pages.
+
+    Pages are scanned as they arrive and are not retained. Matches are
+    returned grouped by keyword (in keyword order), then by page and line.
+    """
+
+    def __init__(self, keywords: list[str], automaton=None, executor: Executor | None = None):
+        """Initialize scanner.
+
+        Args:
+            keywords: List of keywords to search for
+            automaton: Optional automaton from KeywordMatcher.build_automaton(keywords)
+            executor: Optional thread pool; pages are then scanned concurrently
+                and collected in page order by matches()
+        """
+        self.keywords = [keyword.strip() for keyword in keywords]
+        self._automaton = automaton
+        if self._automaton is None:
+            self._automaton = KeywordMatcher.build_automaton(keywords)
+
+        # Regex patterns, compiled up front only when there is no automaton
+        self._patterns = None
+        self._any_keyword = None
+        if self._automaton is None:
+            self._compile_patterns()
+
+        self._matches = [[] for _ in self.keywords]
+        self._executor = executor
+        self._pending = []
+
+    def add_page(self, page: PageContent) -> None:
+        """Scan one page for keyword occurrences.
+
+        Args:
+            page: Page to scan
+        """
+        if self._executor is not None:
+            self._pending.append(self._executor.submit(self.scan_page, page))
+        else:
+            self._add_matches(self.scan_page(page))
+
+    def scan_page(self, page: PageContent) -> list[tuple[int, KeywordMatch]]:
+        """Find keyword occurrences on one page without recording them.
+
+        Safe to call from several threads at once.
+
+        Args:
+            page: Page to scan
+
+        Returns:
+            List of (keyword index, KeywordMatch) in line order per keyword
+        """
+        # Page text is the lines joined with newlines; lines are only split
+        # (and their offsets computed) once a keyword is found
+        hits = self._search_page(page.text)
+        first_hit = next(hits, None)
+        if first_hit is None:
+            return []
+
+        lines = page.get_lines()
+
+        # Offset of each line's first character in text
+        starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+
+        found = []
+        seen = set()
+        for indices, start, end in chain((first_hit,), hits):
+            line_idx = bisect_right(starts, start) - 1
+            # Skip hits spanning a line break (lines may contain newlines)
+            if bisect_right(starts, max(end - 1, start)) - 1 != line_idx:
+                continue
+            # Keep the first occurrence of each keyword per line
+            for index in indices:
+                if (index, line_idx) in seen:
+                    continue
+                seen.add((index, line_idx))
+                found.append((index, KeywordMatch(
+                    keyword=self.keywords[index],
+                    page_number=page.page_number,
+                    line_number=line_idx + 1,
+                    line_text=lines[line_idx],
+                    keyword_end=end - starts[line_idx]
+                )))
+
+        return found
+
+    def matches(self) -> list[KeywordMatch]:
+        """Get all matches found so far.
+
+        Returns:
+            List of KeywordMatch in keyword order
+        """
+        # Collect pages scanned on the executor, in page order
+        pending, self._pending = self._pending, []
+        for future in pending:
+            self._add_matches(future.result())
+
+        return [match for keyword_matches in self._matches for match in keyword_matches]
+
+    def _add_matches(self, found: list[tuple[int, KeywordMatch]]) -> None:
+        """Record matches returned by scan_page().
+
+        Args:
+            found: List of (keyword index, KeywordMatch)
+        """
+        for index, match in found:
+            self._matches[index].append(match)
+
+    def _search_page(self, text: str) -> Iterator[tuple[tuple[int, ...], int, int]]:
+        """Find whole-word keyword occurrences in the text of a page.
+
+        The page is scanned as one string; newlines are non-word characters,
+        so word boundaries are the same as when scanning line by line.
+
+        Args:
+            text: Page lines joined with newlines
+
+        Yields:
+            Tuples of (keyword indices, start offset, end offset), in text
+            order for each keyword
+        """
+        if self._automaton is not None:
+            text_lower = _fold(text)
+
+            # Lowercasing may change offsets (e.g. 'İ'), use regex for such pages
+            if len(text_lower) == len(text):
+                for end, (indices, length) in self._automaton.iter(text_lower):
+                    start = end - length + 1
+                    if _is_boundary(text, start) and _is_boundary(text, end + 1):
+                        yield indices, start, end + 1
+                return
+
+        if self._patterns is None:
+            self._compile_patterns()
+
+        # One pass rules out pages without any keyword before per-keyword scans
+        if not self._any_keyword.search(text):
+            return
+
+        for index, pattern in enumerate(self._patterns):
+            for match_obj in pattern.finditer(text):
+                yield (index,), match_obj.start(), match_obj.end()
+
+    def _compile_patterns(self) -> None:
+        """Compile per-keyword patterns and a combined prefilter pattern."""
+        self._patterns = [_compile_pattern(keyword) for keyword in self.keywords]
+        self._any_keyword = _compile_any(tuple(self.keywords))
@@ -1,15 +1,20 @@
 """Number extractor for finding numerical values near keywords."""
 
 import re
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from functools import lru_cache
 
 from extractors.base import KeywordMatch
 from models.extraction_match import ExtractionMatch
 
+# Proper thousands format: X,XXX or X,XXX,XXX
+THOUSANDS_PATTERN = re.compile(r'^\d{1,3}(?:,\d{3})+$')
+
+
+@lru_cache(maxsize=None)
+def _compile_keyword(keyword: str) -> re.Pattern:
+    """Compile case-insensitive whole-word pattern for keyword (cached)."""
+    return re.compile(r'\b' + re.escape(keyword.strip()) + r'\b', re.IGNORECASE)
+
 
 class NumberExtractor:
     """Extract numbers associated with keywords.
@@ -23,6 +28,9 @@ class NumberExtractor:
 
     # US/UK format: period decimal, optional comma thousands
     # Matches: 3, 3.5, 1,234, 1,234.56
+    # Quantifiers are deliberately not possessive: for '1,2345' the group
+    # must give back ',234' so that '1' still matches. Each repetition
+    # starts with a literal ',' so backtracking stays linear per position.
     NUMBER_PATTERN = re.compile(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b')
 
     def extract_numbers(self, keyword_matches: list[KeywordMatch]) -> list[ExtractionMatch]:
@@ -37,18 +45,14 @@ class NumberExtractor:
         extraction_matches = []
 
         for kw_match in keyword_matches:
-            # Find keyword position in line
-            keyword_lower = kw_match.keyword.lower()
-            line_lower = kw_match.line_text.lower()
-
-            # Escape keyword for regex
-            escaped_keyword = re.escape(keyword_lower)
-
-            # Find keyword position (case-insensitive)
-            keyword_pattern = re.compile(r'\b' + escaped_keyword + r'\b', re.IGNORECASE)
-            match_obj = keyword_pattern.search(kw_match.line_text)
-
-            if not match_obj:
+            # Find keyword position in line, unless the matcher recorded it
+            keyword_end = kw_match.keyword_end
+            if keyword_end is None:
+                match_obj = _compile_keyword(kw_match.keyword).search(kw_match.line_text)
+                if match_obj:
+                    keyword_end = match_obj.end()
+
+            if keyword_end is None:
                 # Keyword not found in line (shouldn't happen, but handle gracefully)
                 extraction_matches.append(ExtractionMatch(
                     keyword=kw_match.keyword,
@@ -60,12 +64,8 @@ class NumberExtractor:
                 ))
                 continue
 
-            # Search for number after keyword in the line
-            keyword_end = match_obj.end()
-            text_after_keyword = kw_match.line_text[keyword_end:]
-
-            # Find first number after keyword
-            number_match = self.NUMBER_PATTERN.search(text_after_keyword)
+            # Find first number after keyword in the line
+            number_match = self.NUMBER_PATTERN.search(kw_match.line_text, keyword_end)
 
             if number_match:
                 value = number_match.group()
@@ -77,8 +77,7 @@ class NumberExtractor:
                 # Ambiguous: contains comma but no decimal point (could be thousands or unusual)
                 if ',' in value and '.' not in value:
                     # Check if it looks like thousands separator
-                    # Pattern: X,XXX or X,XXX,XXX (proper thousands)
-                    if re.match(r'^\d{1,3}(?:,\d{3})+$', value):
+                    if THOUSANDS_PATTERN.match(value):
                         # Proper thousands format
                         warning = (
                             f"Number '{value}' interpreted as thousands separator. "
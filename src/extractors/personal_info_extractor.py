@@ -1,16 +1,41 @@
 """Personal information extractor for identity data."""
 
 import re
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable
 
 from parsers.base import PageContent
 from models.personal_information import PersonalInformation
 
 
+@lru_cache(maxsize=1024)
+def _character_set(parts: tuple[str | None, ...]) -> str:
+    """Detect character set of name parts (cached, names recur across documents)."""
+    cyrillic = PersonalInfoExtractor.CYRILLIC_PATTERN
+    latin = PersonalInfoExtractor.LATIN_PATTERN
+
+    has_cyrillic = False
+    has_latin = False
+    for part in parts:
+        if not part:
+            continue
+        has_cyrillic = has_cyrillic or cyrillic.search(part) is not None
+        has_latin = has_latin or latin.search(part) is not None
+        if has_cyrillic and has_latin:
+            break
+
+    if has_cyrillic and has_latin:
+        return 'mixed'
+    elif has_cyrillic:
+        return 'cyrillic'
+    elif has_latin:
+        return 'latin'
+    else:
+        return 'unknown'
+
+
 class PersonalInfoExtractor:
     """Extract personal information from document.
 
@@ -21,103 +46,66 @@ class PersonalInfoExtractor:
     - ID number: first 4 digits only
     """
 
+    # Name values are captured right after the label colon; leading
+    # whitespace is stripped afterwards. A separate \s* before the capture
+    # would overlap its \s and give the engine two ways to split every
+    # whitespace run.
+
     # First name patterns (Cyrillic and Latin labels)
     FIRST_NAME_PATTERNS = [
-        re.compile(r'(?:First Name|Име|Name|Имя):\s*([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
-        re.compile(r'(?:Given Name|Личное имя):\s*([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
+        re.compile(r'(?:First Name|Име|Name|Имя):([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
+        re.compile(r'(?:Given Name|Личное имя):([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
     ]
 
     # Last name patterns
     LAST_NAME_PATTERNS = [
-        re.compile(r'(?:Last Name|Фамилия|Surname|Фамилія):\s*([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
-        re.compile(r'(?:Family Name):\s*([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
+        re.compile(r'(?:Last Name|Фамилия|Surname|Фамилія):([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
+        re.compile(r'(?:Family Name):([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
     ]
 
     # Middle name patterns
     MIDDLE_NAME_PATTERNS = [
-        re.compile(r'(?:Middle Name|Отчество|Patronymic|По батькові):\s*([А-Яа-яA-Za-z\s\-]+)', re.UNICODE),
+        re.compile(
+            r'(?:Middle Name|Отчество|Patronymic|По батькові)'
+            r':([А-Яа-яA-Za-z\s\-]+)',
+            re.UNICODE
+        ),
     ]
 
     # Age pattern: finds first 1-3 digit number after names
-    # More flexible - doesn't require comma separator
-    AGE_PATTERN = re.compile(r'(?:^|[^\d])(\d{1,3})(?:\s|$|[^\d])', re.UNICODE)
+    # More flexible - doesn't require comma separator. Lookarounds don't
+    # consume the neighbouring characters, so a number right after a
+    # rejected one (e.g. '200 45') is still found.
+    AGE_PATTERN = re.compile(r'(?<!\d)(\d{1,3})(?!\d)', re.UNICODE)
+
+    # Character set detection patterns
+    CYRILLIC_PATTERN = re.compile(r'[А-Яа-я]')
+    LATIN_PATTERN = re.compile(r'[A-Za-z]')
 
-    # ID number pattern (extract first 4 digits only)
+    # Joins page texts for batch scans; matched by no field pattern (nor by
+    # \s), so a match never spans two pages
+    PAGE_SEPARATOR = '\x00'
+
+    # ID number pattern (extract first 4 digits only; the rest of the
+    # number is not matched)
     ID_PATTERNS = [
-        re.compile(r'(?:ID|ЕГН|ID Number|Номер):\s*(\d{4})\d*', re.UNICODE),
-        re.compile(r'(?:Identification|Identifier):\s*(\d{4})\d*', re.UNICODE),
+        re.compile(r'(?:ID|ЕГН|ID Number|Номер):\s*(\d{4})', re.UNICODE),
+        re.compile(r'(?:Identification|Identifier):\s*(\d{4})', re.UNICODE),
     ]
 
-    def extract_personal_info(self, pages: list[PageContent]) -> PersonalInformation:
+    def extract_personal_info(self, pages: Iterable[PageContent]) -> PersonalInformation:
         """Extract personal information from document.
 
         Args:
-            pages: Parsed document pages
+            pages: Parsed document pages (any iterable, consumed once)
 
         Returns:
             PersonalInformation with extracted fields or None values
         """
-        if not pages:
-            return PersonalInformation.empty()
-
-        # Try first page first (most likely location)
-        first_page = pages[0]
-        result = self._extract_from_page(first_page)
-
-        # If incomplete, search remaining pages
-        if not result.is_complete and len(pages) > 1:
-            for page in pages[1:]:
-                if result.first_name is None:
-                    first_name, fn_page = self._extract_first_name([page])
-                    if first_name:
-                        result.first_name = first_name
-                        result.extraction_page = fn_page
-
-                if result.last_name is None:
-                    last_name, ln_page = self._extract_last_name([page])
-                    if last_name:
-                        result.last_name = last_name
-                        if result.extraction_page is None:
-                            result.extraction_page = ln_page
-
-                if result.middle_name is None:
-                    middle_name, mn_page = self._extract_middle_name([page])
-                    if middle_name:
-                        result.middle_name = middle_name
-                        if result.extraction_page is None:
-                            result.extraction_page = mn_page
-
-                if result.id_number_prefix is None:
-                    id_prefix, id_page = self._extract_id_number([page])
-                    if id_prefix:
-                        result.id_number_prefix = id_prefix
-                        if result.extraction_page is None:
-                            result.extraction_page = id_page
-
-                if result.age is None:
-                    age, age_page = self._extract_age([page])
-                    if age:
-                        result.age = age
-                        if result.extraction_page is None:
-                            result.extraction_page = age_page
-
-                # Stop if complete
-                if result.is_complete:
-                    break
-
-        # Detect character set from extracted names
-        if result.first_name or result.last_name or result.middle_name:
-            combined_text = f"{result.first_name or ''} {result.middle_name or ''} {result.last_name or ''}"
-            result.character_set = self._detect_character_set(combined_text)
-
-        # Update is_complete flag
-        result.is_complete = all([
-            result.first_name is not None,
-            result.last_name is not None,
-            result.id_number_prefix is not None
-        ])
-
-        return result
+        collector = PersonalInfoCollector(self)
+        for page in pages:
+            collector.add_page(page)
+        return collector.result()
 
     def _extract_from_page(self, page: PageContent) -> PersonalInformation:
         """Extract all personal info from a single page.
@@ -128,16 +116,11 @@ class PersonalInfoExtractor:
         Returns:
             PersonalInformation with extracted fields
         """
-        first_name, _ = self._extract_first_name([page])
-        last_name, _ = self._extract_last_name([page])
-        middle_name, _ = self._extract_middle_name([page])
-        id_prefix, _ = self._extract_id_number([page])
-        age, _ = self._extract_age([page])
+        first_name, last_name, middle_name, id_prefix, age = self._scan_page(page.text)
 
         character_set = 'unknown'
         if first_name or last_name or middle_name:
-            combined = f"{first_name or ''} {middle_name or ''} {last_name or ''}"
-            character_set = self._detect_character_set(combined)
+            character_set = self._detect_character_set(first_name, middle_name, last_name)
 
         return PersonalInformation(
             first_name=first_name,
@@ -147,126 +130,267 @@ class PersonalInfoExtractor:
             age=age,
             character_set=character_set,
             extraction_page=page.page_number if (first_name or last_name or id_prefix) else None,
-            is_complete=all([first_name, last_name, id_prefix])
+            is_complete=bool(first_name and last_name and id_prefix)
         )
 
-    def _extract_first_name(self, pages: list[PageContent]) -> tuple[str | None, int | None]:
-        """Extract first name from pages.
+    def _scan_page(self, page_text: str) -> tuple:
+        """Search page text for all personal info fields.
 
-        Returns:
-            Tuple of (first_name, page_number) or (None, None)
-        """
-        for page in pages:
-            page_text = page.text
-            for pattern in self.FIRST_NAME_PATTERNS:
-                match = pattern.search(page_text)
-                if match:
-                    name = match.group(1).strip()
-                    return name, page.page_number
-        return None, None
+        Each name pattern is searched once; its match is used both for the
+        name value and to locate where the age search starts.
 
-    def _extract_last_name(self, pages: list[PageContent]) -> tuple[str | None, int | None]:
-        """Extract last name from pages.
+        Args:
+            page_text: Text of the page
 
         Returns:
-            Tuple of (last_name, page_number) or (None, None)
+            Tuple of (first_name, last_name, middle_name, id_prefix, age),
+            each None if not found
         """
-        for page in pages:
-            page_text = page.text
-            for pattern in self.LAST_NAME_PATTERNS:
+        # End of the furthest name label match, age is searched after it
+        name_position = -1
+
+        names = []
+        for patterns in (self.FIRST_NAME_PATTERNS, self.LAST_NAME_PATTERNS,
+                         self.MIDDLE_NAME_PATTERNS):
+            name = None
+            for pattern in patterns:
                 match = pattern.search(page_text)
                 if match:
-                    name = match.group(1).strip()
-                    return name, page.page_number
-        return None, None
+                    name_position = max(name_position, match.end())
+                    if name is None:
+                        name = match.group(1).strip()
+            names.append(name)
+
+        id_prefix = None
+        for pattern in self.ID_PATTERNS:
+            match = pattern.search(page_text)
+            if match:
+                id_prefix = match.group(1)
+                break
+
+        age = self._find_age(page_text, name_position)
+
+        return names[0], names[1], names[2], id_prefix, age
+
+    def _scan_pages(self, pages: list[PageContent], fields: set[str]) -> dict[str, tuple]:
+        """Search several pages for personal info fields in one pass per pattern.
 
-    def _extract_middle_name(self, pages: list[PageContent]) -> tuple[str | None, int | None]:
-        """Extract middle name from pages.
+        Page texts are joined and each pattern is run once over the joined
+        text; match offsets are mapped back to pages. A field takes its
+        value from the first page where it is found, using the same pattern
+        priority as _scan_page().
+
+        Args:
+            pages: Pages to search, in order
+            fields: Fields to search for ('first_name', 'last_name',
+                'middle_name', 'id_number_prefix', 'age')
 
         Returns:
-            Tuple of (middle_name, page_number) or (None, None)
+            Dict of field name -> (value, page_number) for each field found
         """
-        for page in pages:
-            page_text = page.text
-            for pattern in self.MIDDLE_NAME_PATTERNS:
-                match = pattern.search(page_text)
-                if match:
-                    name = match.group(1).strip()
-                    return name, page.page_number
-        return None, None
+        text = self.PAGE_SEPARATOR.join(page.text for page in pages)
+
+        # Offset of each page's first character in text
+        starts = list(accumulate((len(page.text) + 1 for page in pages[:-1]), initial=0))
+
+        # Age search needs every name match to know where it starts on each page
+        find_age = 'age' in fields
+
+        # Per page: end of the furthest name label match (offset in page)
+        name_positions = [-1] * len(pages)
+
+        found = {}
+        for field, patterns in (('first_name', self.FIRST_NAME_PATTERNS),
+                                ('last_name', self.LAST_NAME_PATTERNS),
+                                ('middle_name', self.MIDDLE_NAME_PATTERNS),
+                                ('id_number_prefix', self.ID_PATTERNS)):
+            is_name = field != 'id_number_prefix'
+            if field not in fields and not (is_name and find_age):
+                continue
+
+            # Page index -> value from the highest priority pattern on that page
+            values = {}
+            # Index of first page with a non-empty value
+            first_page_idx = None
+            for pattern in patterns:
+                # Lower priority patterns only matter on earlier pages,
+                # unless name positions are needed for the age search
+                endpos = len(text)
+                if first_page_idx is not None and not (is_name and find_age):
+                    endpos = starts[first_page_idx]
+
+                last_page_idx = -1
+                for match in pattern.finditer(text, 0, endpos):
+                    page_idx = bisect_right(starts, match.start()) - 1
+                    # Only the first match on each page counts
+                    if page_idx == last_page_idx:
+                        continue
+                    last_page_idx = page_idx
+
+                    if is_name:
+                        name_positions[page_idx] = max(name_positions[page_idx],
+                                                       match.end() - starts[page_idx])
+                        value = match.group(1).strip()
+                    else:
+                        value = match.group(1)
+                    values.setdefault(page_idx, value)
+
+                first_page_idx = min((idx for idx, value in values.items() if value),
+                                     default=None)
+
+            if field in fields and first_page_idx is not None:
+                found[field] = (values[first_page_idx], pages[first_page_idx].page_number)
+
+        if find_age:
+            for page_idx, page in enumerate(pages):
+                age = self._find_age(page.text, name_positions[page_idx])
+                if age:
+                    found['age'] = (age, page.page_number)
+                    break
+
+        return found
 
-    def _extract_age(self, pages: list[PageContent]) -> tuple[int | None, int | None]:
-        """Extract age from pages - finds first valid age number after names.
+    def _find_age(self, page_text: str, name_position: int) -> int | None:
+        """Find first valid age number after names.
 
         Strategy:
-        1. First tries to find names in the text
-        2. Searches for first 1-3 digit number after name positions
-        3. Validates age is in 0-150 range
-        4. If no names found, searches entire page for valid age
+        1. Searches for first 1-3 digit number after the name labels
+        2. Validates age is in 0-150 range
+        3. If no names were found, searches entire page for valid age
+
+        Args:
+            page_text: Text of the page
+            name_position: End of the furthest name match, or -1 if none
 
         Returns:
-            Tuple of (age, page_number) or (None, None)
+            Age or None
         """
-        for page in pages:
-            page_text = page.text
+        # Search from after names, or from beginning if no names found
+        # (sliced, so the lookbehind can't see the name text)
+        search_text = page_text[name_position:] if name_position >= 0 else page_text
 
-            # Try to find position of names in text to search after them
-            name_position = -1
+        # Find all potential age numbers (1-3 digits)
+        for match in self.AGE_PATTERN.finditer(search_text):
+            age = int(match.group(1))
+            # Validate age range (0-150)
+            if 0 <= age <= 150:
+                return age
 
-            # Look for any extracted names in the text
-            for pattern in self.FIRST_NAME_PATTERNS + self.LAST_NAME_PATTERNS + self.MIDDLE_NAME_PATTERNS:
-                match = pattern.search(page_text)
-                if match:
-                    name_position = max(name_position, match.end())
+        return None
 
-            # Search from after names, or from beginning if no names found
-            search_text = page_text[name_position:] if name_position >= 0 else page_text
+    def _detect_character_set(self, *parts: str | None) -> str:
+        """Detect character set from text parts.
 
-            # Find all potential age numbers (1-3 digits)
-            for match in self.AGE_PATTERN.finditer(search_text):
-                try:
-                    age = int(match.group(1))
-                    # Validate age range (0-150)
-                    if 0 <= age <= 150:
-                        return age, page.page_number
-                except ValueError:
-                    # Invalid age format, continue searching
-                    continue
+        Args:
+            *parts: Texts to analyze (None parts are skipped)
 
-        return None, None
+        Returns:
+            Character set: 'cyrillic', 'latin', 'mixed', or 'unknown'
+        """
+        return _character_set(parts)
 
-    def _extract_id_number(self, pages: list[PageContent]) -> tuple[str | None, int | None]:
-        """Extract ID number (first 4 digits) from pages.
 
-        Returns:
-            Tuple of (id_prefix, page_number) or (None, None)
+class PersonalInfoCollector:
+    """Incremental personal information extraction over a stream of pages.
+
+    The first page is searched for all fields (most likely location). If
+    that leaves the result incomplete, missing fields are filled from the
+    following pages, which are searched in batches. Batches start at one
+    page (missing fields are usually on the next page) and double up to
+    BATCH_PAGES. Only the current batch is retained.
+    """
+
+    # Maximum pages joined per batch scan; bounds the text held in memory
+    BATCH_PAGES = 16
+
+    def __init__(self, extractor: PersonalInfoExtractor):
+        """Initialize collector.
+
+        Args:
+            extractor: PersonalInfoExtractor providing the field patterns
         """
-        for page in pages:
-            page_text = page.text
-            for pattern in self.ID_PATTERNS:
-                match = pattern.search(page_text)
-                if match:
-                    id_prefix = match.group(1)
-                    return id_prefix, page.page_number
-        return None, None
+        self._extractor = extractor
+        self._result: PersonalInformation | None = None
+        self._batch: list[PageContent] = []
+        self._batch_size = 1
 
-    def _detect_character_set(self, text: str) -> str:
-        """Detect character set from text.
+    def add_page(self, page: PageContent) -> None:
+        """Search one page for personal information.
 
         Args:
-            text: Text to analyze
+            page: Page to search
+        """
+        # Try first page first (most likely location)
+        if self._result is None:
+            self._result = self._extractor._extract_from_page(page)
+            return
+
+        # Required fields found, later pages are not needed
+        if self._result.is_complete:
+            return
+
+        self._batch.append(page)
+        if len(self._batch) >= self._batch_size:
+            self._scan_batch()
+            self._batch_size = min(self._batch_size * 2, self.BATCH_PAGES)
+
+    def _scan_batch(self) -> None:
+        """Fill missing fields from the buffered pages and clear the buffer."""
+        batch, self._batch = self._batch, []
+        result = self._result
+
+        # Only fields still missing are searched for
+        fields = {field for field in ('first_name', 'last_name', 'middle_name',
+                                      'id_number_prefix', 'age')
+                  if getattr(result, field) is None}
+        if not fields:
+            return
+        found = self._extractor._scan_pages(batch, fields)
+
+        # Once the required fields are filled, pages after the one that
+        # completed them are not searched
+        required = [field for field in ('first_name', 'last_name', 'id_number_prefix')
+                    if field in fields]
+        result.is_complete = all(field in found for field in required)
+        if result.is_complete:
+            complete_page = max((found[field][1] for field in required), default=0)
+            found = {field: value for field, value in found.items()
+                     if value[1] <= complete_page}
+
+        for field, (value, _) in found.items():
+            setattr(result, field, value)
+
+        # Extraction page is the first page a field was filled from, except
+        # that a first name found later always takes precedence
+        if result.extraction_page is None and found:
+            result.extraction_page = min(page_number for _, page_number in found.values())
+        if 'first_name' in found:
+            result.extraction_page = found['first_name'][1]
+
+    def result(self) -> PersonalInformation:
+        """Finalize and return the collected personal information.
 
         Returns:
-            Character set: 'cyrillic', 'latin', 'mixed', or 'unknown'
+            PersonalInformation with extracted fields or None values
         """
-        has_cyrillic = bool(re.search(r'[А-Яа-я]', text))
-        has_latin = bool(re.search(r'[A-Za-z]', text))
+        result = self._result
+        if result is None:
+            return PersonalInformation.empty()
 
-        if has_cyrillic and has_latin:
-            return 'mixed'
-        elif has_cyrillic:
-            return 'cyrillic'
-        elif has_latin:
-            return 'latin'
-        else:
-            return 'unknown'
+        if self._batch:
+            self._scan_batch()
+
+        # Detect character set from extracted names
+        if result.first_name or result.last_name or result.middle_name:
+            result.character_set = self._extractor._detect_character_set(
+                result.first_name, result.middle_name, result.last_name
+            )
+
+        # Update is_complete flag
+        result.is_complete = (
+            result.first_name is not None
+            and result.last_name is not None
+            and result.id_number_prefix is not None
+        )
+
+        return result
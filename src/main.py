@@ -2,6 +2,7 @@
 
 import sys
 import os
+import multiprocessing
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -72,6 +73,9 @@ def main():
         print("-" * 50)
         main_window.show()
 
+        # Flush any pending configuration changes
+        app_controller.shutdown()
+
     except KeyboardInterrupt:
         print("\nApplication interrupted by user")
         sys.exit(0)
@@ -84,4 +88,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Required for process pools in frozen (PyInstaller) builds on Windows
+    multiprocessing.freeze_support()
     main()
@@ -1,6 +1,6 @@
 """ApplicationState model for runtime application state."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Union
 from .document import Document
@@ -20,7 +20,16 @@ class ProcessingStatus(Enum):
     PARTIAL_SUCCESS = 'partial_success'
 
 
-@dataclass
+# Statuses from which a new extraction may be started
+_CAN_START_STATUSES = frozenset({
+    ProcessingStatus.READY,
+    ProcessingStatus.COMPLETE,
+    ProcessingStatus.ERROR,
+    ProcessingStatus.PARTIAL_SUCCESS
+})
+
+
+@dataclass(slots=True)
 class ApplicationState:
     """Runtime application state (not persisted).
 
@@ -39,6 +48,63 @@ class ApplicationState:
     extraction_results: Union[ExtractionResults, BatchExtractionResults, None] = None
     error_messages: list[str] = field(default_factory=list)
     is_processing: bool = False
+    # Normalized texts of active_keywords for O(1) duplicate checks
+    _normalized_keywords: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # Whether current_documents is non-empty and all documents are valid
+    _documents_valid: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Derive lookups from initial documents and keywords."""
+        self.reindex()
+
+    def __repr__(self) -> str:
+        """Summarize state without formatting documents and results."""
+        return (
+            f"ApplicationState(documents={len(self.current_documents)}, "
+            f"keywords={len(self.active_keywords)}, "
+            f"status={self.processing_status.value}, "
+            f"errors={len(self.error_messages)}, "
+            f"is_processing={self.is_processing})"
+        )
+
+    def reindex(self) -> None:
+        """Rebuild derived lookups after lists were replaced directly."""
+        self._normalized_keywords = {k.normalized for k in self.active_keywords}
+        self._documents_valid = self._all_valid(self.current_documents)
+
+    @staticmethod
+    def _all_valid(documents: list[Document]) -> bool:
+        """Check that there are documents and all of them are valid."""
+        return len(documents) > 0 and all(doc.is_valid for doc in documents)
+
+    def has_keyword(self, keyword_text: str) -> bool:
+        """Check if a keyword is active (case-insensitive).
+
+        Args:
+            keyword_text: Keyword text to look up
+
+        Returns:
+            True if an active keyword matches
+        """
+        return keyword_text.lower() in self._normalized_keywords
+
+    def snapshot(self) -> "ApplicationState":
+        """Create a copy that is unaffected by later state changes.
+
+        Lists are copied; the documents, keywords and results they hold
+        are shared, as they are not modified once placed in the state.
+
+        Returns:
+            Shallow copy of this state with its own lists
+        """
+        return replace(
+            self,
+            current_documents=list(self.current_documents),
+            active_keywords=list(self.active_keywords),
+            error_messages=list(self.error_messages)
+        )
 
     @property
     def current_document(self) -> Document | None:
@@ -55,20 +121,11 @@ class ApplicationState:
         Returns:
             True if ready to extract, False otherwise
         """
-        has_valid_documents = (
-            len(self.current_documents) > 0
-            and all(doc.is_valid for doc in self.current_documents)
-        )
         return (
-            has_valid_documents
+            self._documents_valid
             and len(self.active_keywords) > 0
             and not self.is_processing
-            and self.processing_status in (
-                ProcessingStatus.READY,
-                ProcessingStatus.COMPLETE,
-                ProcessingStatus.ERROR,
-                ProcessingStatus.PARTIAL_SUCCESS
-            )
+            and self.processing_status in _CAN_START_STATUSES
         )
 
     def set_document(self, document: Document) -> None:
@@ -86,10 +143,10 @@ class ApplicationState:
             documents: List of documents to set
         """
         self.current_documents = documents
+        self._documents_valid = self._all_valid(documents)
 
         # Update status based on validity
-        all_valid = all(doc.is_valid for doc in documents) if documents else False
-        if all_valid and len(documents) > 0:
+        if self._documents_valid:
             if len(self.active_keywords) > 0:
                 self.processing_status = ProcessingStatus.READY
             else:
@@ -108,15 +165,12 @@ class ApplicationState:
         """
         # Check for duplicate (case-insensitive)
         keyword_lower = keyword.normalized
-        if not any(k.normalized == keyword_lower for k in self.active_keywords):
+        if keyword_lower not in self._normalized_keywords:
             self.active_keywords.append(keyword)
+            self._normalized_keywords.add(keyword_lower)
 
             # Update status if documents are selected
-            has_valid_docs = (
-                len(self.current_documents) > 0
-                and all(doc.is_valid for doc in self.current_documents)
-            )
-            if (has_valid_docs
+            if (self._documents_valid
                     and self.processing_status == ProcessingStatus.FILE_SELECTED):
                 self.processing_status = ProcessingStatus.READY
 
@@ -127,10 +181,13 @@ class ApplicationState:
             keyword_text: Text of keyword to remove
         """
         keyword_lower = keyword_text.lower()
-        self.active_keywords = [
-            k for k in self.active_keywords
-            if k.normalized != keyword_lower
-        ]
+        if keyword_lower in self._normalized_keywords:
+            self._normalized_keywords.remove(keyword_lower)
+            # add_keyword() keeps keywords unique, so remove the one match in place
+            for i, k in enumerate(self.active_keywords):
+                if k.normalized == keyword_lower:
+                    del self.active_keywords[i]
+                    break
 
         # Update status if no keywords left
         if len(self.active_keywords) == 0:
@@ -142,6 +199,7 @@ class ApplicationState:
     def clear_keywords(self) -> None:
         """Clear all active keywords."""
         self.active_keywords = []
+        self._normalized_keywords = set()
 
         if len(self.current_documents) > 0:
             self.processing_status = ProcessingStatus.FILE_SELECTED
@@ -176,7 +234,7 @@ class ApplicationState:
         else:
             # Single extraction results
             if results.has_errors():
-                if any(m.status == 'found' for m in results.matches):
+                if results.get_success_count() > 0:
                     self.processing_status = ProcessingStatus.PARTIAL_SUCCESS
                 else:
                     self.processing_status = ProcessingStatus.ERROR
@@ -196,7 +254,9 @@ class ApplicationState:
     def reset(self) -> None:
         """Reset state to initial values."""
         self.current_documents = []
+        self._documents_valid = False
         self.active_keywords = []
+        self._normalized_keywords = set()
         self.processing_status = ProcessingStatus.IDLE
         self.extraction_results = None
         self.error_messages = []
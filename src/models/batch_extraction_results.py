@@ -5,7 +5,7 @@ from datetime import datetime
 from .extraction_results import ExtractionResults
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchExtractionResults:
     """Container for results from multiple document extractions.
 
@@ -22,6 +22,14 @@ class BatchExtractionResults:
     timestamp: datetime = field(default_factory=datetime.now)
     output_path: str | None = None
     warnings: list[str] = field(default_factory=list)
+    # Running aggregates over results, updated by add_result()
+    _total_processing_time: float = field(default=0.0, init=False, repr=False, compare=False)
+    _success_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Compute aggregates for initial results."""
+        self._total_processing_time = sum(r.processing_time for r in self.results)
+        self._success_count = sum(1 for r in self.results if r.get_success_count() > 0)
 
     def add_result(self, result: ExtractionResults) -> None:
         """Add extraction result from a document.
@@ -30,6 +38,9 @@ class BatchExtractionResults:
             result: ExtractionResults from a single document
         """
         self.results.append(result)
+        self._total_processing_time += result.processing_time
+        if result.get_success_count() > 0:
+            self._success_count += 1
 
     def add_warning(self, message: str) -> None:
         """Add a batch-level warning.
@@ -80,7 +91,7 @@ class BatchExtractionResults:
         Returns:
             Sum of processing times in seconds
         """
-        return sum(r.processing_time for r in self.results)
+        return self._total_processing_time
 
     def get_success_count(self) -> int:
         """Get count of documents with at least one successful extraction.
@@ -88,7 +99,7 @@ class BatchExtractionResults:
         Returns:
             Number of documents with found matches
         """
-        return sum(1 for r in self.results if r.get_success_count() > 0)
+        return self._success_count
 
     def get_status_summary(self) -> str:
         """Get human-readable status summary.
@@ -1,12 +1,17 @@
 """Configuration model for application settings."""
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 import os
 import re
 
+# Allowed preset name characters
+_PRESET_NAME_PATTERN = re.compile(r'[a-zA-Z0-9 ]+')
 
-@dataclass
+
+@dataclass(slots=True)
 class Configuration:
     """Application configuration persisted across sessions.
 
@@ -18,10 +23,11 @@ class Configuration:
         keyword_history: Historical keywords
         keyword_presets: Saved keyword presets (list of dicts with 'name' and 'keywords')
         presets_section_expanded: UI state for presets section (collapsed by default)
+        parallel_extraction: Parse large PDFs in a process pool (off by default)
         window_width: Main window width (pixels)
         window_height: Main window height (pixels)
         version: Configuration version
-        last_updated: Last modification timestamp (ISO 8601)
+        last_updated: Last modification timestamp (ISO 8601), stamped by touch() on save
     """
 
     output_folder: str
@@ -31,10 +37,19 @@ class Configuration:
     keyword_history: list[str] = field(default_factory=list)
     keyword_presets: list[dict] = field(default_factory=list)
     presets_section_expanded: bool = False
+    parallel_extraction: bool = False
     window_width: int = 1200
     window_height: int = 1000
     version: str = '1.0.0'
     last_updated: str = ''
+    # Lowercased mirror of keyword_history for O(1) membership checks
+    _keyword_history_lower: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # Lowercased preset name -> preset dict (same objects as keyword_presets)
+    _preset_by_name: dict[str, dict] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate configuration attributes after initialization."""
@@ -74,7 +89,7 @@ class Configuration:
             name = preset['name']
             if not name or len(name) > 50:
                 raise ValueError(f"Preset name must be 1-50 chars: {name}")
-            if not re.match(r'^[a-zA-Z0-9 ]+$', name):
+            if not _PRESET_NAME_PATTERN.fullmatch(name):
                 raise ValueError(f"Invalid characters in preset name: {name}")
 
             # Validate keywords
@@ -83,14 +98,19 @@ class Configuration:
                     raise ValueError(f"Invalid keyword in preset '{name}': {kw}")
 
         # Check for duplicate preset names (case-insensitive)
-        names_lower = [p['name'].lower() for p in self.keyword_presets]
-        if len(names_lower) != len(set(names_lower)):
-            raise ValueError("Duplicate preset names found")
+        self._preset_by_name = {}
+        for preset in self.keyword_presets:
+            name_lower = preset['name'].lower()
+            if name_lower in self._preset_by_name:
+                raise ValueError("Duplicate preset names found")
+            self._preset_by_name[name_lower] = preset
 
         # Update last_updated if not set
         if not self.last_updated:
             self.last_updated = datetime.now().isoformat()
 
+        self._keyword_history_lower = {kw.lower() for kw in self.keyword_history}
+
     @classmethod
     def get_default(cls):
         """Create configuration with default values.
@@ -119,6 +139,14 @@ class Configuration:
             last_updated=datetime.now().isoformat()
         )
 
+    def touch(self) -> None:
+        """Stamp last_updated with the current time.
+
+        Mutators don't stamp the configuration themselves; call this
+        once before persisting a batch of changes.
+        """
+        self.last_updated = datetime.now().isoformat()
+
     def add_keyword_to_history(self, keyword: str) -> None:
         """Add keyword to history (no duplicates, maintain order).
 
@@ -128,21 +156,47 @@ class Configuration:
         keyword = keyword.strip()
         keyword_lower = keyword.lower()
 
-        # Remove existing occurrence (case-insensitive)
-        self.keyword_history = [
-            kw for kw in self.keyword_history
-            if kw.lower() != keyword_lower
-        ]
+        # Already the most recent entry (e.g. added twice in a row)
+        if self.keyword_history and self.keyword_history[-1].lower() == keyword_lower:
+            self.keyword_history[-1] = keyword
+            return
+
+        # Remove existing occurrence (case-insensitive); new keywords skip the scan
+        if keyword_lower in self._keyword_history_lower:
+            self.keyword_history = [
+                kw for kw in self.keyword_history
+                if kw.lower() != keyword_lower
+            ]
 
         # Add to end (most recent)
         self.keyword_history.append(keyword)
+        self._keyword_history_lower.add(keyword_lower)
 
-        # Limit size to 1000
+        # Limit size to 1000, dropping the oldest in place
         if len(self.keyword_history) > 1000:
-            self.keyword_history = self.keyword_history[-1000:]
+            for kw in self.keyword_history[:-1000]:
+                self._keyword_history_lower.discard(kw.lower())
+            del self.keyword_history[:-1000]
 
-        # Update timestamp
-        self.last_updated = datetime.now().isoformat()
+    def append_keyword_to_history(self, keyword: str) -> bool:
+        """Append keyword to history if not already present (case-insensitive).
+
+        Unlike add_keyword_to_history, existing entries keep their position
+        and the history list is mutated in place.
+
+        Args:
+            keyword: Keyword to append
+
+        Returns:
+            True if keyword was appended, False if already in history
+        """
+        keyword_lower = keyword.lower()
+        if keyword_lower in self._keyword_history_lower:
+            return False
+
+        self.keyword_history.append(keyword)
+        self._keyword_history_lower.add(keyword_lower)
+        return True
 
     def remove_keyword_from_history(self, keyword: str) -> None:
         """Remove keyword from history (case-insensitive).
@@ -151,16 +205,17 @@ class Configuration:
             keyword: Keyword to remove
         """
         keyword_lower = keyword.lower()
-        self.keyword_history = [
-            kw for kw in self.keyword_history
-            if kw.lower() != keyword_lower
-        ]
-        self.last_updated = datetime.now().isoformat()
+        if keyword_lower in self._keyword_history_lower:
+            self.keyword_history = [
+                kw for kw in self.keyword_history
+                if kw.lower() != keyword_lower
+            ]
+            self._keyword_history_lower.discard(keyword_lower)
 
     def clear_keyword_history(self) -> None:
         """Clear all keywords from history."""
         self.keyword_history = []
-        self.last_updated = datetime.now().isoformat()
+        self._keyword_history_lower = set()
 
     def validate_paths(self) -> tuple[bool, list[str]]:
         """Validate that paths are writable.
@@ -174,26 +229,45 @@ class Configuration:
         if not os.path.isabs(self.output_folder):
             errors.append("Output folder must be an absolute path")
         else:
-            try:
-                os.makedirs(self.output_folder, exist_ok=True)
-                if not os.access(self.output_folder, os.W_OK):
-                    errors.append(f"Output folder is not writable: {self.output_folder}")
-            except OSError as e:
-                errors.append(f"Cannot create output folder: {e}")
+            error = self._check_writable_directory(self.output_folder, "Output folder")
+            if error:
+                errors.append(error)
 
         # Check log directory
         if not os.path.isabs(self.log_directory):
             errors.append("Log directory must be an absolute path")
         else:
-            try:
-                os.makedirs(self.log_directory, exist_ok=True)
-                if not os.access(self.log_directory, os.W_OK):
-                    errors.append(f"Log directory is not writable: {self.log_directory}")
-            except OSError as e:
-                errors.append(f"Cannot create log directory: {e}")
+            error = self._check_writable_directory(self.log_directory, "Log directory")
+            if error:
+                errors.append(error)
 
         return len(errors) == 0, errors
 
+    def _check_writable_directory(self, path: str, label: str) -> str | None:
+        """Check that a directory is writable, creating it if missing.
+
+        An existing writable directory (the usual case on every save) is
+        confirmed with access() and one stat; makedirs only runs otherwise.
+
+        Args:
+            path: Absolute directory path
+            label: Name used in error messages (e.g. "Output folder")
+
+        Returns:
+            Error message, or None if the directory is writable
+        """
+        if os.access(path, os.W_OK) and os.path.isdir(path):
+            return None
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            if not os.access(path, os.W_OK):
+                return f"{label} is not writable: {path}"
+        except OSError as e:
+            return f"Cannot create {label.lower()}: {e}"
+
+        return None
+
     def _validate_preset_name(self, name: str, exclude_name: str = None) -> tuple[bool, str]:
         """Validate preset name.
 
@@ -209,19 +283,43 @@ class Configuration:
             return False, "Name must be 1-50 characters"
 
         # Pattern check
-        if not re.match(r'^[a-zA-Z0-9 ]+$', name):
+        if not _PRESET_NAME_PATTERN.fullmatch(name):
             return False, "Name can only contain letters, numbers, and spaces"
 
         # Uniqueness check (case-insensitive)
-        existing_names = [
-            p['name'].lower() for p in self.keyword_presets
-            if exclude_name is None or p['name'].lower() != exclude_name.lower()
-        ]
-        if name.lower() in existing_names:
+        name_lower = name.lower()
+        if name_lower in self._preset_by_name and (
+            exclude_name is None or name_lower != exclude_name.lower()
+        ):
             return False, "Preset name already exists"
 
         return True, ""
 
+    def _validate_preset_keywords(self, keywords: list[str]) -> tuple[bool, str]:
+        """Validate preset keywords in a single pass.
+
+        Args:
+            keywords: List of keywords to validate
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not keywords:
+            return False, "Keywords list cannot be empty"
+
+        seen = set()
+        for kw in keywords:
+            if not isinstance(kw, str) or not kw or len(kw) > 100:
+                return False, f"Invalid keyword: {kw}"
+
+            # Check for duplicate keywords (case-insensitive)
+            kw_lower = kw.lower()
+            if kw_lower in seen:
+                return False, "Duplicate keywords in preset"
+            seen.add(kw_lower)
+
+        return True, ""
+
     def add_preset(self, name: str, keywords: list[str]) -> tuple[bool, str]:
         """Add new preset.
 
@@ -238,24 +336,17 @@ class Configuration:
             return False, error_msg
 
         # Validate keywords
-        if not keywords:
-            return False, "Keywords list cannot be empty"
-
-        # Check for duplicate keywords (case-insensitive)
-        keywords_lower = [kw.lower() for kw in keywords]
-        if len(keywords_lower) != len(set(keywords_lower)):
-            return False, "Duplicate keywords in preset"
-
-        for kw in keywords:
-            if not isinstance(kw, str) or not kw or len(kw) > 100:
-                return False, f"Invalid keyword: {kw}"
+        is_valid, error_msg = self._validate_preset_keywords(keywords)
+        if not is_valid:
+            return False, error_msg
 
         # Add preset
-        self.keyword_presets.append({
+        preset = {
             'name': name,
             'keywords': keywords.copy()
-        })
-        self.last_updated = datetime.now().isoformat()
+        }
+        self.keyword_presets.append(preset)
+        self._preset_by_name[name.lower()] = preset
         return True, ""
 
     def update_preset(self, old_name: str, new_name: str, keywords: list[str]) -> tuple[bool, str]:
@@ -270,13 +361,8 @@ class Configuration:
             (success: bool, error_message: str)
         """
         # Find preset (case-insensitive)
-        preset_index = None
-        for i, preset in enumerate(self.keyword_presets):
-            if preset['name'].lower() == old_name.lower():
-                preset_index = i
-                break
-
-        if preset_index is None:
+        preset = self._preset_by_name.get(old_name.lower())
+        if preset is None:
             return False, f"Preset '{old_name}' not found"
 
         # Validate new name (excluding old name from uniqueness check)
@@ -285,24 +371,15 @@ class Configuration:
             return False, error_msg
 
         # Validate keywords
-        if not keywords:
-            return False, "Keywords list cannot be empty"
-
-        # Check for duplicate keywords (case-insensitive)
-        keywords_lower = [kw.lower() for kw in keywords]
-        if len(keywords_lower) != len(set(keywords_lower)):
-            return False, "Duplicate keywords in preset"
-
-        for kw in keywords:
-            if not isinstance(kw, str) or not kw or len(kw) > 100:
-                return False, f"Invalid keyword: {kw}"
+        is_valid, error_msg = self._validate_preset_keywords(keywords)
+        if not is_valid:
+            return False, error_msg
 
-        # Update preset
-        self.keyword_presets[preset_index] = {
-            'name': new_name,
-            'keywords': keywords.copy()
-        }
-        self.last_updated = datetime.now().isoformat()
+        # Update preset in place (keeps its position in keyword_presets)
+        del self._preset_by_name[preset['name'].lower()]
+        preset['name'] = new_name
+        preset['keywords'] = keywords.copy()
+        self._preset_by_name[new_name.lower()] = preset
         return True, ""
 
     def delete_preset(self, name: str) -> bool:
@@ -315,12 +392,12 @@ class Configuration:
             True if preset found and deleted, False if not found
         """
         # Find preset (case-insensitive)
-        for i, preset in enumerate(self.keyword_presets):
-            if preset['name'].lower() == name.lower():
-                del self.keyword_presets[i]
-                self.last_updated = datetime.now().isoformat()
-                return True
-        return False
+        preset = self._preset_by_name.pop(name.lower(), None)
+        if preset is None:
+            return False
+
+        self.keyword_presets.remove(preset)
+        return True
 
     def get_preset_by_name(self, name: str) -> dict | None:
         """Retrieve preset by name.
@@ -331,10 +408,8 @@ class Configuration:
         Returns:
             Preset dict or None if not found
         """
-        for preset in self.keyword_presets:
-            if preset['name'].lower() == name.lower():
-                return preset.copy()
-        return None
+        preset = self._preset_by_name.get(name.lower())
+        return preset.copy() if preset is not None else None
 
     def get_all_presets(self) -> list[dict]:
         """Get all presets (ordered by insertion).
@@ -343,3 +418,15 @@ class Configuration:
             Copy of keyword_presets list
         """
         return [preset.copy() for preset in self.keyword_presets]
+
+    def iter_presets(self) -> Iterator[Mapping]:
+        """Iterate over presets (ordered by insertion) without copying them.
+
+        For read-only callers such as the presets display. Use
+        get_all_presets() when the presets will be modified.
+
+        Yields:
+            Read-only view of each preset dict
+        """
+        for preset in self.keyword_presets:
+            yield MappingProxyType(preset)
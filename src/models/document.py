@@ -1,5 +1,8 @@
 """Document model for file representation and validation."""
 
+import os
+import stat
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -15,7 +18,21 @@ class DocumentState(Enum):
     INVALID = "invalid"
 
 
-@dataclass
+# Valid document state transitions
+_VALID_TRANSITIONS = {
+    DocumentState.UNSELECTED: frozenset({DocumentState.SELECTED}),
+    DocumentState.SELECTED: frozenset({DocumentState.VALIDATING}),
+    DocumentState.VALIDATING: frozenset({DocumentState.VALID, DocumentState.INVALID}),
+    DocumentState.VALID: frozenset({DocumentState.SELECTED}),  # Re-validation
+    DocumentState.INVALID: frozenset({DocumentState.SELECTED}),  # Re-validation
+}
+
+
+# Supported file extensions and their document types
+_FILE_TYPES = {".pdf": "pdf", ".docx": "docx", ".doc": "doc"}
+
+
+@dataclass(slots=True)
 class Document:
     """Represents a PDF, DOCX, or DOC file submitted for processing.
     
@@ -43,8 +60,8 @@ class Document:
         if not Path(self.file_path).is_absolute():
             raise ValueError(f"file_path must be absolute: {self.file_path}")
         
-        # Normalize file_type to lowercase
-        self.file_type = self.file_type.lower()
+        # Normalize file_type to lowercase (interned: lower() always copies)
+        self.file_type = sys.intern(self.file_type.lower())
         
         # Validate file_type
         if self.file_type not in ("pdf", "docx", "doc"):
@@ -70,13 +87,8 @@ class Document:
         extension = path.suffix.lower()
         
         # Map extension to file type
-        if extension == ".pdf":
-            file_type = "pdf"
-        elif extension == ".docx":
-            file_type = "docx"
-        elif extension == ".doc":
-            file_type = "doc"
-        else:
+        file_type = _FILE_TYPES.get(extension)
+        if file_type is None:
             raise ValueError(f"Unsupported file extension: {extension}")
         
         return cls(
@@ -86,13 +98,36 @@ class Document:
             state=DocumentState.SELECTED
         )
     
+    def to_dict(self) -> dict:
+        """Convert document to a plain dict.
+        
+        Returns:
+            Dict of document fields
+        """
+        return {
+            'file_path': self.file_path,
+            'filename': self.filename,
+            'file_type': self.file_type,
+            'page_count': self.page_count,
+            'is_valid': self.is_valid,
+            'error_message': self.error_message,
+            'state': self.state.value,
+        }
+    
+    def _stat(self) -> Optional[os.stat_result]:
+        """Stat the file once, or return None if it can't be accessed."""
+        try:
+            return os.stat(self.file_path)
+        except OSError:
+            return None
+    
     def validate_exists(self) -> bool:
         """Validate that file exists.
         
         Returns:
             True if file exists, False otherwise
         """
-        return Path(self.file_path).exists()
+        return self._stat() is not None
     
     def validate_readable(self) -> bool:
         """Validate that file is readable.
@@ -100,8 +135,8 @@ class Document:
         Returns:
             True if file is readable, False otherwise
         """
-        path = Path(self.file_path)
-        return path.exists() and path.is_file()
+        st = self._stat()
+        return st is not None and stat.S_ISREG(st.st_mode)
     
     def validate_size(self, max_size_mb: int = 50) -> bool:
         """Validate file size is reasonable.
@@ -112,13 +147,41 @@ class Document:
         Returns:
             True if file size is acceptable, False otherwise
         """
-        path = Path(self.file_path)
-        if not path.exists():
+        st = self._stat()
+        if st is None:
             return False
         
-        size_mb = path.stat().st_size / (1024 * 1024)
+        size_mb = st.st_size / (1024 * 1024)
         return size_mb <= max_size_mb
     
+    def validate_all(
+        self, max_size_mb: int = 50
+    ) -> tuple[bool, str, Optional[os.stat_result]]:
+        """Validate existence, readability and size with a single stat call.
+        
+        Args:
+            max_size_mb: Maximum file size in megabytes
+            
+        Returns:
+            Tuple of (is_valid, reason, stat_result). Reason is "File not found",
+            "Not readable" or "Too large" on failure, empty on success.
+            stat_result is the file's os.stat() result, or None if it failed.
+        """
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return False, "File not found", None
+        except OSError:
+            return False, "Not readable", None
+        
+        if not stat.S_ISREG(st.st_mode) or not os.access(self.file_path, os.R_OK):
+            return False, "Not readable", st
+        
+        if st.st_size > max_size_mb * 1024 * 1024:
+            return False, "Too large", st
+        
+        return True, "", st
+    
     def mark_valid(self, page_count: int) -> None:
         """Mark document as valid after successful validation.
         
@@ -149,16 +212,7 @@ class Document:
         Raises:
             ValueError: If transition is invalid
         """
-        # Define valid state transitions
-        valid_transitions = {
-            DocumentState.UNSELECTED: {DocumentState.SELECTED},
-            DocumentState.SELECTED: {DocumentState.VALIDATING},
-            DocumentState.VALIDATING: {DocumentState.VALID, DocumentState.INVALID},
-            DocumentState.VALID: {DocumentState.SELECTED},  # Re-validation
-            DocumentState.INVALID: {DocumentState.SELECTED},  # Re-validation
-        }
-        
-        if state not in valid_transitions.get(self.state, set()):
+        if state not in _VALID_TRANSITIONS.get(self.state, frozenset()):
             raise ValueError(
                 f"Invalid state transition: {self.state.value} -> {state.value}"
             )
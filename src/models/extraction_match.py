@@ -1,9 +1,10 @@
 """ExtractionMatch model for keyword-number matches."""
 
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionMatch:
     """A single instance of a found keyword with its associated numerical value.
 
@@ -32,6 +33,9 @@ class ExtractionMatch:
                 f"Invalid status: {self.status}. Must be one of {valid_statuses}"
             )
 
+        # Share one string object per status (e.g. when read from JSON)
+        self.status = sys.intern(self.status)
+
         # Validate page number
         if self.page_number < 1:
             raise ValueError(f"Page number must be >= 1, got: {self.page_number}")
@@ -47,3 +51,18 @@ class ExtractionMatch:
         # Ensure value consistency with status
         if self.status == 'not_found' and self.value not in (None, 'Not found', ''):
             self.value = 'Not found'
+
+    def to_dict(self) -> dict:
+        """Convert match to a plain dict (cheaper than dataclasses.asdict).
+
+        Returns:
+            Dict of match fields
+        """
+        return {
+            'keyword': self.keyword,
+            'value': self.value,
+            'page_number': self.page_number,
+            'line_number': self.line_number,
+            'status': self.status,
+            'warning': self.warning,
+        }
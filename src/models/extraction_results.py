@@ -1,13 +1,43 @@
 """ExtractionResults model for extraction operation results."""
 
+import json
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, time
+from enum import Enum
 from .document import Document
 from .personal_information import PersonalInformation
 from .extraction_match import ExtractionMatch
+from .keyword import Keyword
 
+# Optional: orjson serializes dicts to JSON bytes much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_default(obj):
+    """Convert values json/orjson can't serialize on their own.
+
+    Used by both serializers, so datetimes, enums and nested models are
+    written the same way whichever one is installed.
+
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, Keyword):
+        # Keywords (e.g. in error context) are written as their text
+        return obj.text
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
 class ExtractionResults:
     """Container for all results from a single extraction operation.
 
@@ -32,6 +62,19 @@ class ExtractionResults:
     timestamp: datetime = field(default_factory=datetime.now)
     output_path: str | None = None
     log_path: str | None = None
+    # Match count per status, updated by add_match() / extend_matches()
+    _status_counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Count statuses of initial matches."""
+        for match in self.matches:
+            self._count_status(match.status)
+
+    def _count_status(self, status: str) -> None:
+        """Record one more match with the given status."""
+        self._status_counts[status] = self._status_counts.get(status, 0) + 1
 
     def add_match(self, match: ExtractionMatch) -> None:
         """Add successful extraction match.
@@ -40,6 +83,18 @@ class ExtractionResults:
             match: ExtractionMatch to add
         """
         self.matches.append(match)
+        self._count_status(match.status)
+
+    def extend_matches(self, matches: list[ExtractionMatch]) -> None:
+        """Add several matches at once, collecting their warnings.
+
+        Args:
+            matches: ExtractionMatch objects to add, in order
+        """
+        self.matches.extend(matches)
+        self.warnings.extend(m.warning for m in matches if m.warning)
+        for match in matches:
+            self._count_status(match.status)
 
     def add_error(self, error_type: str, message: str, context: dict | None = None) -> None:
         """Add error with context.
@@ -110,7 +165,7 @@ class ExtractionResults:
         Returns:
             Number of matches with status 'found'
         """
-        return sum(1 for m in self.matches if m.status == 'found')
+        return self._status_counts.get('found', 0)
 
     def get_not_found_count(self) -> int:
         """Get count of keywords not found.
@@ -118,7 +173,7 @@ class ExtractionResults:
         Returns:
             Number of matches with status 'not_found'
         """
-        return sum(1 for m in self.matches if m.status == 'not_found')
+        return self._status_counts.get('not_found', 0)
 
     def get_ambiguous_count(self) -> int:
         """Get count of ambiguous matches.
@@ -126,7 +181,7 @@ class ExtractionResults:
         Returns:
             Number of matches with status 'ambiguous'
         """
-        return sum(1 for m in self.matches if m.status == 'ambiguous')
+        return self._status_counts.get('ambiguous', 0)
 
     def get_status_summary(self) -> str:
         """Get human-readable status summary.
@@ -149,6 +204,56 @@ class ExtractionResults:
 
         return f"Total: {total} ({', '.join(parts)})"
 
+    def to_dict(self) -> dict:
+        """Convert results to plain dicts and lists for export.
+
+        Built by hand instead of dataclasses.asdict, which deep-copies
+        every nested field through reflection.
+
+        Returns:
+            Dict of result fields; timestamp is an ISO 8601 string
+        """
+        return {
+            'document': self.document.to_dict(),
+            'personal_info': self.personal_info.to_dict(),
+            'matches': [match.to_dict() for match in self.matches],
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'processing_time': self.processing_time,
+            'timestamp': self.timestamp.isoformat(),
+            'output_path': self.output_path,
+            'log_path': self.log_path,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize results to compact UTF-8 encoded JSON.
+
+        orjson and the json fallback give the same bytes: no whitespace,
+        non-ASCII written as-is, int/bool/None dict keys written as strings,
+        and datetimes, enums and models passed through _json_default().
+        Known differences: floats that repr() writes in exponent form are
+        spelled differently (orjson '1e-7' and '0.000025', json '1e-07' and
+        '2.5e-05'; same value), and NaN/Infinity become null with orjson
+        but NaN/Infinity with json.
+
+        Returns:
+            JSON document as bytes
+
+        Raises:
+            TypeError: If a value (e.g. in error context) can't be serialized
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(
+                data,
+                default=_json_default,
+                option=(orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                        | orjson.OPT_PASSTHROUGH_DATACLASS),
+            )
+        return json.dumps(
+            data, ensure_ascii=False, separators=(',', ':'), default=_json_default
+        ).encode('utf-8')
+
     @classmethod
     def create(cls, document: Document):
         """Create new extraction results for a document.
@@ -1,11 +1,33 @@
 """Keyword model for search term representation."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def _compile_keyword(text: str, case_insensitive: bool, unicode_support: bool,
+                     word_boundaries: bool) -> re.Pattern:
+    """Compile regex pattern for keyword text (cached)."""
+    # Escape keyword for regex
+    pattern = re.escape(text)
+    
+    # Add word boundaries if requested
+    if word_boundaries:
+        pattern = r'\b' + pattern + r'\b'
+    
+    # Build regex flags
+    flags = 0
+    if case_insensitive:
+        flags |= re.IGNORECASE
+    if unicode_support:
+        flags |= re.UNICODE
+    
+    return re.compile(pattern, flags)
+
+
+@dataclass(slots=True)
 class Keyword:
     """A user-defined search term for locating numerical values in documents.
     
@@ -20,6 +42,8 @@ class Keyword:
     normalized: str = ""
     is_historical: bool = False
     is_active: bool = True
+    # hash(normalized), computed once; text/normalized are not reassigned after init
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate and normalize keyword attributes."""
@@ -36,6 +60,8 @@ class Keyword:
         # Generate normalized version if not provided
         if not self.normalized:
             self.normalized = self.text.lower()
+        
+        self._hash = hash(self.normalized)
     
     @classmethod
     def from_text(cls, text: str, is_historical: bool = False) -> "Keyword":
@@ -79,23 +105,9 @@ class Keyword:
             word_boundaries: Whether to add word boundary markers
             
         Returns:
-            Compiled regex pattern
+            Compiled regex pattern (cached per keyword text and options)
         """
-        # Escape keyword for regex
-        pattern = self.sanitize_for_regex()
-        
-        # Add word boundaries if requested
-        if word_boundaries:
-            pattern = r'\b' + pattern + r'\b'
-        
-        # Build regex flags
-        flags = 0
-        if case_insensitive:
-            flags |= re.IGNORECASE
-        if unicode_support:
-            flags |= re.UNICODE
-        
-        return re.compile(pattern, flags)
+        return _compile_keyword(self.text, case_insensitive, unicode_support, word_boundaries)
     
     def matches(self, other: "Keyword") -> bool:
         """Check if this keyword matches another (case-insensitive).
@@ -110,13 +122,15 @@ class Keyword:
     
     def __eq__(self, other) -> bool:
         """Check equality based on normalized text."""
+        if self is other:
+            return True
         if not isinstance(other, Keyword):
             return False
-        return self.normalized == other.normalized
+        return self._hash == other._hash and self.normalized == other.normalized
     
     def __hash__(self) -> int:
         """Hash based on normalized text for set/dict operations."""
-        return hash(self.normalized)
+        return self._hash
     
     def __str__(self) -> str:
         """String representation showing original text."""
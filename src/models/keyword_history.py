@@ -1,38 +1,55 @@
 """Keyword history model for persistent keyword storage."""
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, List, Optional
 
 
-@dataclass
 class KeywordHistory:
     """Persistent collection of previously used keywords across sessions.
-    
+
+    Keywords are stored in an ordered dict keyed by lowercased text, so
+    lookups and moving a keyword to the most recent position are O(1).
+
     Attributes:
-        keywords: Ordered list of unique keywords (most recent last)
+        keywords: Ordered list of unique keywords (most recent last, read-only)
         last_updated: Last modification timestamp
         max_size: Maximum number of keywords to retain (unlimited by default)
     """
-    
-    keywords: List[str] = field(default_factory=list)
-    last_updated: Optional[datetime] = None
-    max_size: int = 1000  # Practical limit
-    
-    def __post_init__(self):
-        """Initialize timestamp if not set."""
-        if self.last_updated is None:
-            self.last_updated = datetime.now()
-    
+
+    def __init__(self, keywords: Optional[Iterable[str]] = None,
+                 last_updated: Optional[datetime] = None, max_size: int = 1000):
+        """Initialize history.
+
+        Args:
+            keywords: Initial keywords, oldest first; later case-insensitive
+                duplicates are ignored
+            last_updated: Last modification timestamp (defaults to now)
+            max_size: Maximum number of keywords to retain
+        """
+        # Lowercased keyword -> keyword as entered, oldest first
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        for keyword in keywords or ():
+            self._entries.setdefault(keyword.lower(), keyword)
+
+        self.last_updated = last_updated if last_updated is not None else datetime.now()
+        self.max_size = max_size  # Practical limit
+
+    @property
+    def keywords(self) -> List[str]:
+        """Ordered list of keywords (most recent last)."""
+        return self.to_list()
+
     def add(self, keyword: str) -> bool:
         """Add keyword to history if not already present.
-        
+
         Case-insensitive duplicate check. If keyword exists, it's moved to end
         (most recent position).
-        
+
         Args:
             keyword: Keyword to add
-            
+
         Returns:
             True if keyword was added or moved, False if invalid
         """
@@ -40,117 +57,117 @@ class KeywordHistory:
         keyword = keyword.strip()
         if not keyword or len(keyword) > 100:
             return False
-        
+
         keyword_lower = keyword.lower()
-        
-        # Check for duplicate (case-insensitive)
-        existing = [kw for kw in self.keywords if kw.lower() == keyword_lower]
-        
-        if existing:
-            # Remove existing (will re-add at end)
-            self.keywords.remove(existing[0])
-        
-        # Add to end (most recent)
-        self.keywords.append(keyword)
-        
-        # Enforce max size
-        if len(self.keywords) > self.max_size:
-            # Remove oldest (from beginning)
-            self.keywords = self.keywords[-self.max_size:]
-        
+
+        # Add or move to end (most recent), keeping the latest spelling
+        self._entries[keyword_lower] = keyword
+        self._entries.move_to_end(keyword_lower)
+
+        # Enforce max size, removing oldest (from beginning)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
         # Update timestamp
         self.last_updated = datetime.now()
-        
+
         return True
-    
+
     def remove(self, keyword: str) -> bool:
         """Remove keyword from history (case-insensitive).
-        
+
         Args:
             keyword: Keyword to remove
-            
+
         Returns:
             True if keyword was removed, False if not found
         """
-        keyword_lower = keyword.lower()
-        
-        # Find matching keyword (case-insensitive)
-        matching = [kw for kw in self.keywords if kw.lower() == keyword_lower]
-        
-        if matching:
-            self.keywords.remove(matching[0])
+        if self._entries.pop(keyword.lower(), None) is not None:
             self.last_updated = datetime.now()
             return True
-        
+
         return False
-    
+
     def contains(self, keyword: str) -> bool:
         """Check if keyword exists in history (case-insensitive).
-        
+
         Args:
             keyword: Keyword to check
-            
+
         Returns:
             True if keyword exists, False otherwise
         """
-        keyword_lower = keyword.lower()
-        return any(kw.lower() == keyword_lower for kw in self.keywords)
-    
+        return keyword.lower() in self._entries
+
     def get_recent(self, count: int = 10) -> List[str]:
         """Get most recent keywords.
-        
+
         Args:
             count: Number of recent keywords to return
-            
+
         Returns:
             List of recent keywords (most recent last)
         """
-        return self.keywords[-count:] if count < len(self.keywords) else self.keywords.copy()
-    
+        if count <= 0:
+            return self.to_list()[-count:]
+
+        recent = list(islice(reversed(self._entries.values()), count))
+        recent.reverse()
+        return recent
+
     def clear(self) -> None:
         """Clear all keywords from history."""
-        self.keywords.clear()
+        self._entries.clear()
         self.last_updated = datetime.now()
-    
+
     def select_multiple(self, keywords: List[str]) -> List[str]:
         """Select multiple keywords from history.
-        
+
         Args:
             keywords: List of keyword texts to select
-            
+
         Returns:
             List of keywords that exist in history
         """
         selected = []
         for keyword in keywords:
-            keyword_lower = keyword.lower()
             # Find matching keyword (preserve original case from history)
-            matching = [kw for kw in self.keywords if kw.lower() == keyword_lower]
-            if matching:
-                selected.append(matching[0])
-        
+            matching = self._entries.get(keyword.lower())
+            if matching is not None:
+                selected.append(matching)
+
         return selected
-    
+
     def to_list(self) -> List[str]:
         """Get ordered list of all keywords.
-        
+
         Returns:
             List of all keywords (most recent last)
         """
-        return self.keywords.copy()
-    
+        return list(self._entries.values())
+
     def __len__(self) -> int:
         """Get number of keywords in history."""
-        return len(self.keywords)
-    
+        return len(self._entries)
+
     def __contains__(self, keyword: str) -> bool:
         """Check if keyword exists in history (case-insensitive)."""
         return self.contains(keyword)
-    
+
     def __iter__(self):
         """Iterate over keywords in order."""
-        return iter(self.keywords)
-    
+        return iter(self._entries.values())
+
+    def __eq__(self, other) -> bool:
+        """Check equality of keywords, timestamp and size limit."""
+        if not isinstance(other, KeywordHistory):
+            return NotImplemented
+        return (
+            list(self._entries.values()) == list(other._entries.values())
+            and self.last_updated == other.last_updated
+            and self.max_size == other.max_size
+        )
+
     def __repr__(self) -> str:
         """Debug representation."""
         return (
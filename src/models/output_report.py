@@ -5,7 +5,7 @@ from .personal_information import PersonalInformation
 from .extraction_match import ExtractionMatch
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputReport:
     """Plain text file containing all extraction results for a single document.
 
@@ -38,7 +38,8 @@ class OutputReport:
         if not self.output_path:
             raise ValueError("Output path must be non-empty")
 
-    def get_filename_from_document(self, document_filename: str) -> str:
+    @staticmethod
+    def get_filename_from_document(document_filename: str) -> str:
         """Generate output filename from document filename.
 
         Args:
@@ -47,11 +48,9 @@ class OutputReport:
         Returns:
             Output filename in format: output_[original_filename].txt
         """
-        # Remove extension if present
-        if '.' in document_filename:
-            base_name = document_filename.rsplit('.', 1)[0]
-        else:
-            base_name = document_filename
+        # Remove extension if present (single scan from the right)
+        head, dot, _ = document_filename.rpartition('.')
+        base_name = head if dot else document_filename
 
         return f"output_{base_name}.txt"
 
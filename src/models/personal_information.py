@@ -2,8 +2,11 @@
 
 from dataclasses import dataclass
 
+# Allowed character set values
+_VALID_CHARACTER_SETS = ('cyrillic', 'latin', 'mixed', 'unknown')
 
-@dataclass
+
+@dataclass(slots=True)
 class PersonalInformation:
     """Structured identity data extracted from document.
 
@@ -30,11 +33,10 @@ class PersonalInformation:
     def __post_init__(self):
         """Validate personal information attributes after initialization."""
         # Validate character set
-        valid_character_sets = ('cyrillic', 'latin', 'mixed', 'unknown')
-        if self.character_set not in valid_character_sets:
+        if self.character_set not in _VALID_CHARACTER_SETS:
             raise ValueError(
                 f"Invalid character_set: {self.character_set}. "
-                f"Must be one of {valid_character_sets}"
+                f"Must be one of {_VALID_CHARACTER_SETS}"
             )
 
         # Validate extraction page if present
@@ -59,11 +61,28 @@ class PersonalInformation:
                 )
 
         # Update is_complete based on field values
-        self.is_complete = all([
-            self.first_name is not None,
-            self.last_name is not None,
-            self.id_number_prefix is not None
-        ])
+        self.is_complete = (
+            self.first_name is not None
+            and self.last_name is not None
+            and self.id_number_prefix is not None
+        )
+
+    def to_dict(self) -> dict:
+        """Convert personal information to a plain dict.
+
+        Returns:
+            Dict of extracted fields
+        """
+        return {
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'middle_name': self.middle_name,
+            'id_number_prefix': self.id_number_prefix,
+            'age': self.age,
+            'character_set': self.character_set,
+            'extraction_page': self.extraction_page,
+            'is_complete': self.is_complete,
+        }
 
     @property
     def full_name(self) -> str | None:
@@ -1,21 +1,22 @@
 """ProcessingLog model for timestamped extraction logs."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """A single log entry with timestamp and context.
 
     Attributes:
-        timestamp: When event occurred
+        timestamp_ns: When event occurred (time.time_ns())
         level: Log level ('INFO', 'WARNING', 'ERROR')
         message: Log message
         context: Additional context data
     """
 
-    timestamp: datetime
+    timestamp_ns: int
     level: str
     message: str
     context: dict | None = None
@@ -31,17 +32,24 @@ class LogEntry:
         if not self.message:
             raise ValueError("Log message must be non-empty")
 
+    @property
+    def timestamp(self) -> datetime:
+        """When event occurred, as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+
     def format(self) -> str:
         """Format log entry as string.
 
         Returns:
             Formatted log entry string
         """
-        timestamp_str = self.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        # Formatted only when the log is written, not when the entry is added
+        seconds = self.timestamp_ns // 1_000_000_000
+        timestamp_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
         return f"{timestamp_str} [{self.level}] {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingLog:
     """Timestamped log file recording extraction events, warnings, and errors.
 
@@ -84,7 +92,7 @@ class ProcessingLog:
             context: Optional context data
         """
         entry = LogEntry(
-            timestamp=datetime.now(),
+            timestamp_ns=time.time_ns(),
             level=level,
             message=message,
             context=context
@@ -1,6 +1,8 @@
 """Base classes and data structures for document parsers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 
 
@@ -21,31 +23,37 @@ class ScannedPDFError(ParsingError):
 
 
 # Data Structures
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Text content of a single page.
 
     Attributes:
         page_number: Page number (1-indexed)
-        text: Full page text
-        lines: Text split by line breaks
+        text: Full page text (the lines joined with newlines)
+        lines: Text split into lines; None until get_lines() if not provided
     """
 
     page_number: int
     text: str
-    lines: list[str]
+    lines: list[str] | None = None
 
     def __post_init__(self):
         """Validate page content after initialization."""
         if self.page_number < 1:
             raise ValueError(f"Page number must be >= 1, got: {self.page_number}")
 
-        # Ensure lines are derived from text if not provided
+    def get_lines(self) -> list[str]:
+        """Get page lines, splitting text by line breaks on first use.
+
+        Returns:
+            Lines of the page
+        """
         if not self.lines and self.text:
             self.lines = self.text.split('\n')
+        return self.lines or []
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of document parsing operation.
 
@@ -75,7 +83,7 @@ class ParseResult:
             raise ValueError(f"Page count must be >= 0, got: {self.page_count}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of document validation.
 
@@ -151,6 +159,25 @@ class DocumentParser(ABC):
         """
         pass
 
+    def iter_pages(self, file_path: str, executor: Executor | None = None) -> Iterator[PageContent]:
+        """Yield document pages one at a time.
+
+        The default implementation parses the whole document first;
+        parsers that can read pages incrementally override this.
+
+        Args:
+            file_path: Absolute path to document file
+            executor: Optional process pool for parsers that can read
+                page ranges in parallel (ignored by default)
+
+        Yields:
+            PageContent for each page, in order
+
+        Raises:
+            Same exceptions as parse()
+        """
+        yield from self.parse(file_path).pages
+
     def _check_file_exists(self, file_path: str) -> None:
         """Check if file exists and is readable.
 
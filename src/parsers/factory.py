@@ -35,15 +35,13 @@ class ParserFactory:
 
         Raises:
             ValueError: If file extension is not supported
-            FileNotFoundError: If file doesn't exist
-        """
-        # Check file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
 
+        Note:
+            File existence is not checked here; parsers report missing
+            files from parse()/validate().
+        """
         # Extract extension (case-insensitive)
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
+        ext = os.path.splitext(file_path)[1].lower()
 
         # Get parser class
         parser_class = cls.PARSER_MAP.get(ext)
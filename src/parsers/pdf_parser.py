@@ -1,5 +1,10 @@
 """PDF document parser using PyMuPDF (fitz)."""
 
+import math
+import os
+from collections.abc import Iterator
+from concurrent.futures import Executor
+
 import fitz  # PyMuPDF
 from .base import (
     DocumentParser,
@@ -12,6 +17,24 @@ from .base import (
 )
 
 
+def _extract_page_texts(file_path: str, start: int, stop: int) -> list[str]:
+    """Extract text of pages [start, stop) (runs in a worker process).
+
+    Args:
+        file_path: Absolute path to PDF file
+        start: First page index (0-based)
+        stop: Page index to stop before
+
+    Returns:
+        Text of each page in the range
+    """
+    doc = fitz.open(file_path)
+    try:
+        return [doc[page_num].get_text("text") for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
 class PDFParser(DocumentParser):
     """Parse PDF documents using PyMuPDF (fitz).
 
@@ -20,8 +43,15 @@ class PDFParser(DocumentParser):
     - Detect password-protected PDFs
     - Detect scanned PDFs (no extractable text)
     - UTF-8 encoding support for Cyrillic/Latin text
+    - Optional multi-process page reading for large documents
     """
 
+    # Process pool start-up outweighs the gain below this size
+    PARALLEL_MIN_PAGES = 30
+
+    # Target number of pages per worker task
+    PAGES_PER_CHUNK = 16
+
     def parse(self, file_path: str) -> ParseResult:
         """Parse PDF and extract text content.
 
@@ -60,26 +90,17 @@ class PDFParser(DocumentParser):
                 page = doc[page_num]
                 text = page.get_text("text")
 
-                # Split into lines
-                lines = text.split('\n')
-
+                # Lines are split from text on first use
                 pages.append(PageContent(
                     page_number=page_num + 1,  # 1-indexed
-                    text=text,
-                    lines=lines
+                    text=text
                 ))
 
             doc.close()
 
             # Check if scanned PDF (< 10 chars in first 3 pages)
             if len(pages) > 0:
-                first_pages_text = ''.join(
-                    p.text for p in pages[:3]
-                )
-                if len(first_pages_text.strip()) < 10:
-                    raise ScannedPDFError(
-                        "Scanned PDFs requiring OCR are not supported"
-                    )
+                self._check_not_scanned(pages[:3])
 
             # Check if empty
             if len(pages) == 0:
@@ -100,6 +121,123 @@ class PDFParser(DocumentParser):
         except Exception as e:
             raise ParsingError(f"Failed to parse PDF: {str(e)}")
 
+    def iter_pages(self, file_path: str, executor: Executor | None = None) -> Iterator[PageContent]:
+        """Yield PDF pages one at a time without holding the whole text.
+
+        Args:
+            file_path: Absolute path to PDF file
+            executor: Optional process pool; documents with at least
+                PARALLEL_MIN_PAGES pages are read in page ranges across it
+
+        Yields:
+            PageContent for each page, in order
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file is not readable
+            PasswordProtectedError: If PDF is password-protected (FR-052)
+            ScannedPDFError: If PDF has no extractable text (FR-053)
+            ParsingError: For other parsing failures
+        """
+        # Check file exists and is readable
+        self._check_file_exists(file_path)
+
+        # Buffer first 3 pages for the scanned PDF check (< 10 chars)
+        head = []
+        for page_num, text in enumerate(self._iter_page_texts(file_path, executor)):
+            page = PageContent(
+                page_number=page_num + 1,  # 1-indexed
+                text=text
+            )
+
+            if head is None:
+                yield page
+                continue
+
+            head.append(page)
+            if len(head) == 3:
+                self._check_not_scanned(head)
+                yield from head
+                head = None
+
+        if head:
+            self._check_not_scanned(head)
+            yield from head
+
+    def _iter_page_texts(self, file_path: str, executor: Executor | None) -> Iterator[str]:
+        """Yield page texts in order, sequentially or from a process pool.
+
+        Args:
+            file_path: Absolute path to PDF file
+            executor: Optional process pool
+
+        Yields:
+            Text of each page
+
+        Raises:
+            PasswordProtectedError: If PDF is password-protected
+            ParsingError: For other parsing failures
+        """
+        try:
+            doc = fitz.open(file_path)
+        except Exception as e:
+            raise ParsingError(f"Failed to parse PDF: {str(e)}")
+
+        try:
+            # Check if password-protected
+            if doc.is_encrypted:
+                raise PasswordProtectedError(
+                    "Password-protected PDFs are not supported"
+                )
+
+            page_count = len(doc)
+
+            if executor is None or page_count < self.PARALLEL_MIN_PAGES:
+                for page_num in range(page_count):
+                    try:
+                        yield doc[page_num].get_text("text")
+                    except Exception as e:
+                        raise ParsingError(f"Failed to parse PDF: {str(e)}")
+                return
+
+            # Split pages into contiguous ranges, one task per range
+            chunk_count = min(os.cpu_count() or 1, math.ceil(page_count / self.PAGES_PER_CHUNK))
+            chunk_size = math.ceil(page_count / chunk_count)
+            futures = [
+                executor.submit(_extract_page_texts, file_path, start,
+                                min(start + chunk_size, page_count))
+                for start in range(0, page_count, chunk_size)
+            ]
+
+            try:
+                for future in futures:
+                    try:
+                        texts = future.result()
+                    except Exception as e:
+                        raise ParsingError(f"Failed to parse PDF: {str(e)}")
+                    yield from texts
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        finally:
+            doc.close()
+
+    def _check_not_scanned(self, pages: list[PageContent]) -> None:
+        """Raise ScannedPDFError if the first pages have no real text.
+
+        Args:
+            pages: First (up to 3) pages of the document
+
+        Raises:
+            ScannedPDFError: If pages contain fewer than 10 characters
+        """
+        first_pages_text = ''.join(p.text for p in pages)
+        if len(first_pages_text.strip()) < 10:
+            raise ScannedPDFError(
+                "Scanned PDFs requiring OCR are not supported"
+            )
+
     def validate(self, file_path: str) -> ValidationResult:
         """Validate PDF without full parsing.
 
@@ -6,9 +6,6 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from models.configuration import Configuration
 
 
@@ -93,6 +90,7 @@ class ConfigurationManager:
                 keyword_history=data.get('keyword_history', []),
                 keyword_presets=valid_presets,
                 presets_section_expanded=data.get('presets_section_expanded', False),
+                parallel_extraction=data.get('parallel_extraction', False),
                 window_width=data.get('window_width', 800),
                 window_height=data.get('window_height', 600),
                 version=data.get('version', '1.0.0'),
@@ -147,8 +145,7 @@ class ConfigurationManager:
                 return False
 
             # Update last_updated timestamp
-            from datetime import datetime
-            config.last_updated = datetime.now().isoformat()
+            config.touch()
 
             # Prepare data for JSON
             data = {
@@ -160,6 +157,7 @@ class ConfigurationManager:
                 'keyword_history': config.keyword_history,
                 'keyword_presets': config.keyword_presets,
                 'presets_section_expanded': config.presets_section_expanded,
+                'parallel_extraction': config.parallel_extraction,
                 'window_width': config.window_width,
                 'window_height': config.window_height,
                 'last_updated': config.last_updated
@@ -171,10 +169,8 @@ class ConfigurationManager:
             with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
-            # Rename temp file to actual config file
-            if os.path.exists(self.config_path):
-                os.remove(self.config_path)
-            os.rename(temp_path, self.config_path)
+            # Replace config file atomically
+            os.replace(temp_path, self.config_path)
 
             return True
 
@@ -1,12 +1,8 @@
 """Output generator for creating plain text extraction reports."""
 
 import os
-import sys
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from models.extraction_results import ExtractionResults
 from models.batch_extraction_results import BatchExtractionResults
 from models.configuration import Configuration
@@ -1,12 +1,8 @@
 """Processing logger for timestamped extraction logs."""
 
 import os
-import sys
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from models.processing_log import ProcessingLog, LogEntry
 from models.extraction_results import ExtractionResults
 
@@ -131,3 +127,38 @@ class ProcessingLogger:
         if self.current_log:
             return self.current_log.log_path
         return None
+
+
+class NullProcessingLogger:
+    """Logger that discards all events.
+
+    Used before the first extraction starts, so callers never need to
+    check whether a logger is set.
+    """
+
+    def start_logging(self, document_filename: str, keywords: list[str]) -> str | None:
+        """Ignore start of logging."""
+        return None
+
+    def log_event(self, level: str, message: str, context: dict | None = None) -> None:
+        """Ignore event."""
+
+    def info(self, message: str, context: dict | None = None) -> None:
+        """Ignore INFO level message."""
+
+    def warning(self, message: str, context: dict | None = None) -> None:
+        """Ignore WARNING level message."""
+
+    def error(self, message: str, context: dict | None = None) -> None:
+        """Ignore ERROR level message."""
+
+    def finalize(self, status: str, results: ExtractionResults | None = None) -> None:
+        """Ignore finalize."""
+
+    def get_log_path(self) -> str | None:
+        """Get path to current log file.
+
+        Returns:
+            Always None
+        """
+        return None
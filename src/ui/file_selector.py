@@ -1,10 +1,13 @@
 """FileSelector - File selection component with drag-and-drop support."""
 
+import logging
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
 from ui.theme import AppTheme
 
+log = logging.getLogger(__name__)
+
 
 class FileSelector(ttk.Frame):
     """File selection area with browse and drag-and-drop support.
@@ -190,7 +193,7 @@ class FileSelector(ttk.Frame):
         Args:
             file_paths: List of file paths to select
         """
-        print(f"DEBUG FileSelector._select_files called with {len(file_paths)} files")
+        log.debug("_select_files called with %s files", len(file_paths))
 
         valid_files = []
         errors = []
@@ -225,9 +228,9 @@ class FileSelector(ttk.Frame):
         self._update_display_multi(valid_files)
 
         # Notify callback with list of valid files
-        print(f"DEBUG FileSelector: callback registered = {self._file_selected_callback is not None}")
+        log.debug("callback registered = %s", self._file_selected_callback is not None)
         if self._file_selected_callback:
-            print(f"DEBUG FileSelector: calling callback with {len(valid_files)} files")
+            log.debug("calling callback with %s files", len(valid_files))
             self._file_selected_callback(valid_files)
 
     def _update_display(self, file_path: str):
@@ -1,9 +1,13 @@
 """KeywordPanel - Keyword management panel with history and active keywords."""
 
+import logging
 import tkinter as tk
+from collections.abc import Iterable, Mapping
 from tkinter import ttk
 from ui.theme import AppTheme
 
+log = logging.getLogger(__name__)
+
 
 class KeywordPanel(ttk.Frame):
     """Keyword management panel.
@@ -463,28 +467,28 @@ class KeywordPanel(ttk.Frame):
     
     def _on_load_preset_clicked(self, preset_name: str):
         """Handle Load button click on preset card."""
-        print(f"DEBUG KeywordPanel: Load clicked for preset '{preset_name}'")
-        print(f"DEBUG KeywordPanel: Active keywords: {len(self._active_keywords)}")
-        print(f"DEBUG KeywordPanel: Load callback registered: {self._preset_load_callback is not None}")
+        log.debug("Load clicked for preset '%s'", preset_name)
+        log.debug("Active keywords: %s", len(self._active_keywords))
+        log.debug("Load callback registered: %s", self._preset_load_callback is not None)
         
         # Check if there are active keywords
         if self._active_keywords:
             # Show confirmation
-            print(f"DEBUG KeywordPanel: Showing confirmation dialog")
+            log.debug("Showing confirmation dialog")
             if self._show_load_confirmation(preset_name):
-                print(f"DEBUG KeywordPanel: Confirmation accepted, calling callback")
+                log.debug("Confirmation accepted, calling callback")
                 # Load preset
                 if self._preset_load_callback:
                     self._preset_load_callback(preset_name)
             else:
-                print(f"DEBUG KeywordPanel: Confirmation cancelled")
+                log.debug("Confirmation cancelled")
         else:
             # No active keywords, load directly
-            print(f"DEBUG KeywordPanel: No active keywords, loading directly")
+            log.debug("No active keywords, loading directly")
             if self._preset_load_callback:
                 self._preset_load_callback(preset_name)
             else:
-                print(f"DEBUG KeywordPanel: ERROR - No callback registered!")
+                log.warning("No callback registered!")
     
     def _update_create_button_state(self):
         """Enable/disable Create button based on active keywords."""
@@ -845,9 +849,10 @@ class KeywordPanel(ttk.Frame):
 
     def _calculate_grid_positions(self):
         """Calculate and apply flow/wrap positions for all grid items."""
-        print(f"[DEBUG] _calculate_grid_positions called, items: {len(self.grid_items) if hasattr(self, 'grid_items') else 0}")
+        log.debug("_calculate_grid_positions called, items: %s",
+                  len(self.grid_items) if hasattr(self, 'grid_items') else 0)
         if not self.grid_items or not self.grid_container.winfo_exists():
-            print(f"[DEBUG] Returning early - no items or container doesn't exist")
+            log.debug("Returning early - no items or container doesn't exist")
             return
         
         # Constants
@@ -882,7 +887,9 @@ class KeywordPanel(ttk.Frame):
             item_height = label.winfo_reqheight()
             
             if i == 0:  # Debug first item
-                print(f"[DEBUG] First item: width={item_width}, height={item_height}, text='{label.cget('text')}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("First item: width=%s, height=%s, text='%s'",
+                              item_width, item_height, label.cget('text'))
             
             # Wrap to next row if needed
             if current_x + item_width > container_width and current_x > 0:
@@ -894,7 +901,7 @@ class KeywordPanel(ttk.Frame):
             label.place(x=current_x, y=current_y)
             
             if i == 0:  # Debug first item placement
-                print(f"[DEBUG] First item placed at: x={current_x}, y={current_y}")
+                log.debug("First item placed at: x=%s, y=%s", current_x, current_y)
             
             # Update tracking
             current_x += item_width + ITEM_SPACING
@@ -906,7 +913,8 @@ class KeywordPanel(ttk.Frame):
             actual_height = 30
         canvas_height = min(actual_height, MAX_GRID_HEIGHT)
         
-        print(f"[DEBUG] Container width: {container_width}, actual_height: {actual_height}, canvas_height: {canvas_height}")
+        log.debug("Container width: %s, actual_height: %s, canvas_height: %s",
+                  container_width, actual_height, canvas_height)
         
         self.grid_container.configure(height=canvas_height)
         
@@ -922,13 +930,13 @@ class KeywordPanel(ttk.Frame):
 
     def _populate_history(self):
         """Populate grid with keyword items from history."""
-        print(f"[DEBUG] _populate_history called")
-        print(f"[DEBUG] Has grid_frame: {hasattr(self, 'grid_frame')}")
+        log.debug("_populate_history called")
+        log.debug("Has grid_frame: %s", hasattr(self, 'grid_frame'))
         if hasattr(self, 'grid_frame'):
-            print(f"[DEBUG] grid_frame exists: {self.grid_frame.winfo_exists()}")
+            log.debug("grid_frame exists: %s", self.grid_frame.winfo_exists())
         
         if not hasattr(self, 'grid_frame') or not self.grid_frame.winfo_exists():
-            print(f"[DEBUG] Returning early - no grid_frame")
+            log.debug("Returning early - no grid_frame")
             return
         
         # Clear existing items
@@ -941,9 +949,9 @@ class KeywordPanel(ttk.Frame):
         active_keyword_texts = self._active_keywords
         available_keywords = [kw for kw in history_keywords if kw not in active_keyword_texts]
         
-        print(f"[DEBUG] History keywords: {history_keywords}")
-        print(f"[DEBUG] Active keywords: {active_keyword_texts}")
-        print(f"[DEBUG] Available keywords: {available_keywords}")
+        log.debug("History keywords: %s", history_keywords)
+        log.debug("Active keywords: %s", active_keyword_texts)
+        log.debug("Available keywords: %s", available_keywords)
         
         # Create grid items
         for keyword in available_keywords:
@@ -971,7 +979,7 @@ class KeywordPanel(ttk.Frame):
             
             self.grid_items.append(label)
         
-        print(f"[DEBUG] Created {len(self.grid_items)} grid items")
+        log.debug("Created %s grid items", len(self.grid_items))
         
         # Layout items
         self._calculate_grid_positions()
@@ -1296,13 +1304,14 @@ class KeywordPanel(ttk.Frame):
         self._presets_section_toggle_callback = callback
     
     # Preset public methods
-    def refresh_presets(self, presets: list[dict]):
+    def refresh_presets(self, presets: Iterable[Mapping]):
         """Update preset cards display.
         
         Args:
-            presets: List of preset dicts from Configuration
+            presets: Read-only preset views from Configuration.iter_presets()
+                (the panel never modifies them; edits go through callbacks)
         """
-        self._presets = [preset.copy() for preset in presets]
+        self._presets = list(presets)
         self._render_preset_cards()
         self._update_header_text()
     
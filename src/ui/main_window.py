@@ -3,10 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import logging
 
 from models.configuration import Configuration
 from models.application_state import ApplicationState
@@ -18,6 +15,8 @@ from ui.progress_bar import ProgressBar
 from ui.results_display import ResultsDisplay
 from ui.theme import AppTheme
 
+log = logging.getLogger(__name__)
+
 
 class MainWindow:
     """Main application window.
@@ -182,7 +181,7 @@ class MainWindow:
         self.keyword_panel.on_presets_section_toggled(self._handle_presets_section_toggle)
         # Initialize preset panel state
         self.keyword_panel.set_presets_expanded(self.config.presets_section_expanded)
-        self.keyword_panel.refresh_presets(self.config.get_all_presets())
+        self.keyword_panel.refresh_presets(self.config.iter_presets())
 
         current_row += 1
 
@@ -356,7 +355,8 @@ class MainWindow:
         Args:
             file_paths: List of selected file paths
         """
-        print(f"DEBUG MainWindow._handle_file_selected: {len(file_paths)} files, callback={self._file_selected_callback is not None}")
+        log.debug("_handle_file_selected: %s files, callback=%s",
+                  len(file_paths), self._file_selected_callback is not None)
         if self._file_selected_callback:
             self._file_selected_callback(file_paths)
 
@@ -385,30 +385,30 @@ class MainWindow:
         if self._preset_create_callback:
             self._preset_create_callback(name, keywords)
             # Refresh presets display after creation
-            self.keyword_panel.refresh_presets(self.config.get_all_presets())
+            self.keyword_panel.refresh_presets(self.config.iter_presets())
     
     def _handle_preset_load(self, preset_name: str):
         """Handle preset load event."""
-        print(f"DEBUG MainWindow: _handle_preset_load called for '{preset_name}'")
-        print(f"DEBUG MainWindow: Callback registered: {self._preset_load_callback is not None}")
+        log.debug("_handle_preset_load called for '%s'", preset_name)
+        log.debug("Callback registered: %s", self._preset_load_callback is not None)
         if self._preset_load_callback:
             self._preset_load_callback(preset_name)
         else:
-            print(f"DEBUG MainWindow: ERROR - No callback registered!")
+            log.warning("No callback registered!")
     
     def _handle_preset_edit(self, old_name: str, new_name: str, keywords: list[str]):
         """Handle preset edit event."""
         if self._preset_edit_callback:
             self._preset_edit_callback(old_name, new_name, keywords)
             # Refresh presets display after edit
-            self.keyword_panel.refresh_presets(self.config.get_all_presets())
+            self.keyword_panel.refresh_presets(self.config.iter_presets())
     
     def _handle_preset_delete(self, name: str):
         """Handle preset delete event."""
         if self._preset_delete_callback:
             self._preset_delete_callback(name)
             # Refresh presets display after deletion
-            self.keyword_panel.refresh_presets(self.config.get_all_presets())
+            self.keyword_panel.refresh_presets(self.config.iter_presets())
     
     def _handle_presets_section_toggle(self, expanded: bool):
         """Handle presets section toggle event."""
@@ -447,7 +447,7 @@ class MainWindow:
         Args:
             state: Current application state
         """
-        print(f"DEBUG MainWindow: update_state called with {len(state.active_keywords)} active keywords")
+        log.debug("update_state called with %s active keywords", len(state.active_keywords))
 
         # Update file selector - handle both single document and multiple documents
         if state.current_documents:
@@ -461,7 +461,7 @@ class MainWindow:
 
         # Update keyword panel
         keyword_texts = [kw.text for kw in state.active_keywords]
-        print(f"DEBUG MainWindow: Setting keywords in panel: {keyword_texts}")
+        log.debug("Setting keywords in panel: %s", keyword_texts)
         self.keyword_panel.set_active_keywords(keyword_texts)
 
         # Update progress bar state
@@ -1,9 +1,12 @@
 """ProgressBar - Progress indicator and Extract button."""
 
+import logging
 import tkinter as tk
 from tkinter import ttk
 from ui.theme import AppTheme
 
+log = logging.getLogger(__name__)
+
 
 class ProgressBar(ttk.Frame):
     """Progress bar and Extract button component.
@@ -175,7 +178,9 @@ class ProgressBar(ttk.Frame):
         """
         from models.application_state import ProcessingStatus
         
-        print(f"DEBUG ProgressBar.update_state: doc={state.current_document is not None}, keywords={len(state.active_keywords)}, processing={state.is_processing}, status={state.processing_status}")
+        log.debug("update_state: doc=%s, keywords=%s, processing=%s, status=%s",
+                  state.current_document is not None, len(state.active_keywords),
+                  state.is_processing, state.processing_status)
         
         # Update state based on processing status
         if state.is_processing:
@@ -2,12 +2,8 @@
 
 import tkinter as tk
 from tkinter import ttk, filedialog
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from models.configuration import Configuration
 from ui.theme import AppTheme
 